@@ -1,4 +1,4 @@
-"""Entity API routes: flush, query, delete, stats, version."""
+"""Entity API routes: flush, query, count, delete, stats, version."""
 
 from typing import Annotated, Optional
 
@@ -49,6 +49,17 @@ def entities_query(entities: Entities, body: QueryBody) -> StreamingResponse:
     return StreamingResponse(generate(), media_type=NDJSON_CONTENT_TYPE)
 
 
+@router.post("/{dataset}/_api/entities/count")
+def entities_count(entities: Entities, body: QueryBody) -> PlainTextResponse:
+    """Count entities matching the query, without assembling them."""
+    count = entities.count(
+        body.to_query(),
+        flush_first=body.flush_first,
+        origin=body.origin,
+    )
+    return PlainTextResponse(str(count))
+
+
 @router.delete("/{dataset}/_api/entities/{entity_id}")
 def entities_delete(entities: Entities, entity_id: str) -> PlainTextResponse:
     """Delete all statements for an entity, return count of tombstones."""
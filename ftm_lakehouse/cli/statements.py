@@ -5,6 +5,7 @@ Sub-typer group, parallel to ``entities`` but at the statement grain:
     ftm-lakehouse statements iterate   # parquet -> statements CSV (live read)
     ftm-lakehouse statements stream    # statements.csv export -> stdout
     ftm-lakehouse statements import    # statements CSV -> parquet (no journal)
+    ftm-lakehouse statements partitions  # per-partition files / rows / size
 """
 
 from datetime import datetime
@@ -139,3 +140,19 @@ def cli_statements_sql(query: str):
     for row in rows:
         table.add_row(*("" if value is None else str(value) for value in row))
     Console().print(table)
+
+
+@statements.command("partitions")
+def cli_statements_partitions():
+    """Show physical per-partition counters (files, rows, bytes), rendered as a
+    table.
+
+    Read from the Delta transaction log only – no data scan, so cheap on any
+    store size. Rows include pre-merge duplicates and tombstones.
+    """
+    with DatasetContext() as (name, uri):
+        stats = get_entities(name, uri)._statements.partition_stats()
+    table = Table(*stats.column_names, caption=f"{stats.num_rows} partition(s)")
+    for row in stats.to_pylist():
+        table.add_row(*(str(value) for value in row.values()))
+    Console().print(table)
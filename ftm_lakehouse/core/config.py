@@ -1,5 +1,7 @@
 """Configuration loading utilities."""
 
+from typing import Any
+
 import yaml
 from anystore.store import Store
 from anystore.types import SDict
@@ -7,6 +9,17 @@ from anystore.util import dict_merge
 
 from ftm_lakehouse.core.conventions import path
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+
+def load_yaml(data: str | bytes) -> Any:
+    """``yaml.safe_load`` on libyaml's C parser where PyYAML was built with it
+    (the pure-Python parser otherwise) – same safe subset, same result."""
+    return yaml.load(data, Loader=YamlLoader)
+
 
 def load_config(storage: Store, **data) -> SDict:
     """
@@ -20,7 +33,7 @@ def load_config(storage: Store, **data) -> SDict:
         data
     """
     if storage.exists(path.CONFIG):
-        config = storage.get(path.CONFIG, deserialization_func=yaml.safe_load)
+        config = storage.get(path.CONFIG, deserialization_func=load_yaml)
     else:
         config = {"name": data.get("name") or "catalog"}
     config = dict_merge(config, data)
@@ -30,6 +30,7 @@ Dataset Layout
             .LOCK-APPENDS/                  # in-flight append markers
             locks/{tenant}/                 # operation-specific locks
             tags/{tenant}/                  # workflow state / cache
+            cache/crawl/{source_hash}.json  # crawl checksums by (key, size, mtime)
 
             archive/                        # content-addressed file storage
                 ab/cd/ef/{checksum}/        # SHA256 split into segments
@@ -141,6 +142,22 @@ def tag(*parts: str, tenant: str | None = TENANT) -> str:
     return join_relpaths(TAGS, tenant or TENANT, *parts)
 
 
+CACHE = "cache"
+"""Base path for derived data that is safe to delete"""
+
+
+def crawl_checksums(source: str) -> str:
+    """
+    Get the checksum cache path for a crawl source.
+
+    Layout: cache/crawl/{source_hash}.json
+
+    Args:
+        source: The crawl source store uri
+    """
+    return f"{CACHE}/crawl/{hash_data(source)}.json"
+
+
 ARCHIVE = "archive"
 """Base path for archive"""
 
@@ -8,31 +8,55 @@ from ftm_lakehouse.core.settings import CHECKSUM_ALGORITHM
 
 
 def make_resource(
-    uri: str, mime_type: str | None = None, public_url: str | None = None
+    uri: str,
+    mime_type: str | None = None,
+    public_url: str | None = None,
+    previous: DataResource | None = None,
 ) -> DataResource:
+    """Describe the file at ``uri`` as a :class:`DataResource`.
+
+    Computing the checksum reads the whole file. ``previous`` is the resource
+    as published before: callers pass it only when they know the file wasn't
+    rewritten since (see the export index), and its checksum is then reused
+    unless the size differs. The size is the only check: a stale ``previous``
+    of a rewritten file with the same size publishes a wrong checksum, which
+    this function cannot detect – the caller's freshness decision must hold.
+    """
     res = UriResource(uri)
     info = res.info()
+    if previous is not None and previous.size == info.size:
+        checksum = previous.checksum
+    else:
+        checksum = res.checksum(algorithm=CHECKSUM_ALGORITHM)
     return DataResource(
         name=res.name,
         url=public_url or uri,
-        checksum=res.checksum(algorithm=CHECKSUM_ALGORITHM),
+        checksum=checksum,
         timestamp=info.created_at,
         mime_type=mime_type or info.mimetype,
         size=info.size,
     )
 
 
-def make_entities_resource(uri: str, public_url: str | None = None) -> DataResource:
-    return make_resource(uri, FTM, public_url)
+def make_entities_resource(
+    uri: str, public_url: str | None = None, previous: DataResource | None = None
+) -> DataResource:
+    return make_resource(uri, FTM, public_url, previous)
 
 
-def make_statements_resource(uri: str, public_url: str | None = None) -> DataResource:
-    return make_resource(uri, CSV, public_url)
+def make_statements_resource(
+    uri: str, public_url: str | None = None, previous: DataResource | None = None
+) -> DataResource:
+    return make_resource(uri, CSV, public_url, previous)
 
 
-def make_documents_resource(uri: str, public_url: str | None = None) -> DataResource:
-    return make_resource(uri, CSV, public_url)
+def make_documents_resource(
+    uri: str, public_url: str | None = None, previous: DataResource | None = None
+) -> DataResource:
+    return make_resource(uri, CSV, public_url, previous)
 
 
-def make_statistics_resource(uri: str, public_url: str | None = None) -> DataResource:
-    return make_resource(uri, JSON, public_url)
+def make_statistics_resource(
+    uri: str, public_url: str | None = None, previous: DataResource | None = None
+) -> DataResource:
+    return make_resource(uri, JSON, public_url, previous)
@@ -73,6 +73,26 @@ MIME_SCHEMAS = {
 }
 
 
+def _invert_mime_schemas() -> dict[str, Schema]:
+    """Invert `MIME_SCHEMAS` – as with a scan over it, the first entry for a
+    mimetype wins, and empty mimetypes / schemas are skipped."""
+    inverted: dict[str, Schema] = {}
+    for mtypes, schema in MIME_SCHEMAS.items():
+        if schema is None:
+            continue
+        for mimetype in mtypes:
+            if mimetype:
+                inverted.setdefault(mimetype, schema)
+    return inverted
+
+
+_MIME_SCHEMA = _invert_mime_schemas()
+"""Inverted `MIME_SCHEMAS` for a single hashed lookup per mimetype"""
+
+_DOCUMENT: Schema = model["Document"]
+"""Fallback schema for mimetypes without a specific mapping"""
+
+
 @cache
 def mime_to_schema(mimetype: str) -> Schema:
     """
@@ -90,12 +110,7 @@ def mime_to_schema(mimetype: str) -> Schema:
     Returns:
         The schema name as string
     """
-    mimetype = normalize_mimetype(mimetype)
-    for mtypes, schema in MIME_SCHEMAS.items():
-        if mimetype in mtypes:
-            if schema is not None:
-                return schema
-    return model["Document"]
+    return _MIME_SCHEMA.get(normalize_mimetype(mimetype), _DOCUMENT)
 
 
 def pick_mime(mimetypes: Iterable[str], default: str | None = None) -> str:
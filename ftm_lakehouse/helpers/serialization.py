@@ -1,3 +1,5 @@
+from typing import Callable
+
 from anystore.model.base import BaseModel
 from anystore.types import M, Uri
 from anystore.util import dump_json_model, dump_yaml_model, get_extension
@@ -5,19 +7,39 @@ from anystore.util import dump_json_model, dump_yaml_model, get_extension
 YAML = ("yml", "yaml")
 
 
+def _dump_json(obj: BaseModel) -> bytes:
+    return dump_json_model(obj, clean=True, newline=True)
+
+
+def _dump_yaml(obj: BaseModel) -> bytes:
+    return dump_yaml_model(obj, clean=True, newline=True)
+
+
+def _load_json(data: bytes, model: type[M]) -> M:
+    # validate the raw bytes in pydantic's json parser, no intermediate str
+    return model.model_validate_json(data)
+
+
+def _load_yaml(data: bytes, model: type[M]) -> M:
+    return model.from_yaml_str(data.decode())
+
+
+_DUMPERS: dict[str | None, Callable[[BaseModel], bytes]] = {
+    ext: _dump_yaml for ext in YAML
+}
+_LOADERS: dict[str | None, Callable[[bytes, type], BaseModel]] = {
+    ext: _load_yaml for ext in YAML
+}
+
+
 def dump_model(key: Uri, obj: BaseModel) -> bytes:
     """Dump a pydantic model to bytes, either json (the default) or yaml
     (inferred from key extension)"""
-    ext = get_extension(key)
-    if ext in YAML:
-        return dump_yaml_model(obj, clean=True, newline=True)
-    return dump_json_model(obj, clean=True, newline=True)
+    return _DUMPERS.get(get_extension(key), _dump_json)(obj)
 
 
 def load_model(key: Uri, data: bytes, model: type[M]) -> M:
     """Load a bytes string as a pydantic model, either json (the default) or
     yaml (inferred from key extension)"""
-    ext = get_extension(key)
-    if ext in YAML:
-        return model.from_yaml_str(data.decode())
-    return model.from_json_str(data.decode())
+    loader = _LOADERS.get(get_extension(key), _load_json)
+    return loader(data, model)  # type: ignore[return-value]
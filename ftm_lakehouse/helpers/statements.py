@@ -1,18 +1,27 @@
 """Statement serialization logic."""
 
+import sys
 from datetime import datetime, timezone
 from hashlib import sha1
-from typing import Generator, Iterable
+from typing import IO, Generator, Iterable
 
+import pyarrow as pa
 from anystore.io.read import smart_stream_csv
-from anystore.types import Uri
+from anystore.types import SDict, Uri
 from followthemoney import Statement
 from followthemoney.statement.util import BASE_ID
 from followthemoney.util import HASH_ENCODING
 from ftmq.store.base import DEFAULT_ORIGIN
 from ftmq.store.lake import LakeStatement
+from pyarrow.csv import (  # type: ignore[attr-defined]  # missing from stubs
+    ConvertOptions,
+    ParseOptions,
+    ReadOptions,
+    open_csv,
+)
 
 from ftm_lakehouse.exceptions import MalformedStatementError
+from ftm_lakehouse.model.statement import STATEMENT_CSV_COLUMNS
 
 UNIT_SEP = "\x1f"
 """Field separator used to pack a Statement into the journal ``data`` column."""
@@ -71,6 +80,11 @@ def pack_statement(stmt: Statement) -> str:
 def unpack_statement(data: str) -> Statement:
     """Unpack a unit-separator delimited string back into a Statement.
 
+    The low-cardinality ``prop`` / ``schema`` / ``dataset`` / ``origin``
+    fields are interned: a journal flush unpacks millions of rows and holds
+    up to a write batch of them at once, which then share one string object
+    per distinct value instead of one copy per row.
+
     Raises:
         MalformedStatementError: If ``data`` has fewer than
             :data:`UNPACK_MIN_FIELDS` separator-delimited fields. The
@@ -86,16 +100,16 @@ def unpack_statement(data: str) -> Statement:
     return Statement(
         id=parts[0] or None,
         entity_id=parts[1],  # required
-        prop=parts[2],  # required
-        schema=parts[3],  # required
+        prop=sys.intern(parts[2]),  # required
+        schema=sys.intern(parts[3]),  # required
         value=parts[4],  # required
-        dataset=parts[5],  # required
+        dataset=sys.intern(parts[5]),  # required
         lang=parts[6] or None,
         original_value=parts[7] or None,
         external=parts[8] == "1",
         first_seen=parts[9] or None,
         last_seen=parts[10] or None,
-        origin=parts[11] or None,
+        origin=sys.intern(parts[11]) if parts[11] else None,
     )
 
 
@@ -152,7 +166,8 @@ def read_csv_statements(uri: Uri) -> Generator[LakeStatement, None, None]:
     needs its own reader. Rows are streamed as dicts via
     :func:`anystore.io.read.smart_stream_csv` and mapped straight to
     ``LakeStatement``; ``fragment`` is read from its column when present and
-    falls back to the empty-string (non-fragment) sentinel otherwise.
+    falls back to the empty-string (non-fragment) sentinel otherwise. As in
+    :func:`unpack_statement`, the low-cardinality fields are interned.
 
     Args:
         uri: Location of the statements CSV.
@@ -165,15 +180,63 @@ def read_csv_statements(uri: Uri) -> Generator[LakeStatement, None, None]:
         yield LakeStatement(
             id=row.get("id") or None,
             entity_id=row["entity_id"],
-            prop=row["prop"],
-            schema=row["schema"],
+            prop=sys.intern(row["prop"]),
+            schema=sys.intern(row["schema"]),
             value=row.get("value") or "",
-            dataset=row["dataset"],
+            dataset=sys.intern(row["dataset"]),
             lang=row.get("lang") or None,
             original_value=row.get("original_value") or None,
             external=str(row.get("external", "")).strip().lower() in ("true", "1"),
             first_seen=row.get("first_seen") or None,
             last_seen=row.get("last_seen") or None,
-            origin=row.get("origin") or None,
+            origin=sys.intern(row["origin"]) if row.get("origin") else None,
             fragment=row.get("fragment") or "",
         )
+
+
+CSV_READ_BLOCK_SIZE = 1 << 24
+"""Bytes per block the Arrow CSV reader parses at once (16 MiB)."""
+
+
+def stream_csv_rows(
+    fh: IO[bytes], columns: Iterable[str] | None = None
+) -> Generator[SDict, None, None]:
+    """Stream a statements CSV from a binary handle as row dicts.
+
+    Parses with pyarrow's (multi-threaded, vectorized) CSV reader block by
+    block instead of tokenizing row by row via :class:`csv.DictReader`, and
+    builds the dicts per record batch. The known
+    :data:`~ftm_lakehouse.model.statement.STATEMENT_CSV_COLUMNS` are read as
+    plain strings – empty cells stay ``""`` rather than becoming null – so
+    rows are the same ``str`` dicts ``csv.DictReader`` yields. Quoted
+    newlines inside values are supported.
+
+    Args:
+        fh: Readable binary handle (already decompressed).
+        columns: Only read these columns (all must be present in the
+            header). Unread columns are neither converted nor put into the
+            row dicts, so consumers that need a few fields allocate smaller
+            rows.
+
+    Yields:
+        One dict per CSV row, keyed by header column.
+    """
+    try:
+        reader = open_csv(
+            fh,
+            read_options=ReadOptions(block_size=CSV_READ_BLOCK_SIZE),
+            parse_options=ParseOptions(newlines_in_values=True),
+            convert_options=ConvertOptions(
+                column_types={c: pa.string() for c in STATEMENT_CSV_COLUMNS},
+                strings_can_be_null=False,
+                include_columns=list(columns) if columns is not None else None,
+            ),
+        )
+    except pa.ArrowInvalid as e:
+        # an export of an all-deleted store is a zero-byte file without
+        # header, which the arrow reader rejects
+        if "Empty CSV file" in str(e):
+            return
+        raise
+    for batch in reader:
+        yield from batch.to_pylist()
@@ -40,18 +40,24 @@ guarded by a ``python_version<'3.14'`` marker – and get byte-identical
 frames from an identical API.
 """
 
+import os
 import sys
 from enum import StrEnum
+from functools import cache
 from gzip import GzipFile
-from io import TextIOWrapper
+from io import BufferedWriter, TextIOWrapper
 from typing import IO, Any, cast
 
 from anystore.logic.constants import DEFAULT_MODE, DEFAULT_WRITE_MODE
 
 if sys.version_info >= (3, 14):
-    from compression.zstd import ZstdFile
+    from compression.zstd import CompressionParameter, ZstdFile
 else:
-    from backports.zstd import ZstdFile
+    from backports.zstd import CompressionParameter, ZstdFile
+
+
+WRITE_BUFFER_SIZE = 1 << 20
+"""Bytes gathered before a compressor sees them (1 MiB)."""
 
 
 class CompressKind(StrEnum):
@@ -76,6 +82,24 @@ def _as_mode(stream: IO[bytes], mode: str) -> IO[Any]:
     return TextIOWrapper(stream, encoding="utf-8", newline="")
 
 
+@cache
+def _zstd_write_options() -> dict[CompressionParameter, int] | None:
+    """Compress zstd frames on background worker threads where available.
+
+    Exports are multi-GB and compression runs inline with the writer, so
+    zstd's own worker pool takes it off the producing thread. A libzstd built
+    without multithreading reports ``nb_workers`` bounds of ``(0, 0)`` – then
+    the default single-threaded compressor is used. The frame format is the
+    same either way, and multithreaded output does not depend on the worker
+    count, so artifacts stay byte-identical across hosts.
+    """
+    _, upper = CompressionParameter.nb_workers.bounds()
+    workers = min(os.cpu_count() or 1, upper)
+    if workers < 1:
+        return None
+    return {CompressionParameter.nb_workers: workers}
+
+
 def compress_stream(
     fh: IO[bytes],
     algorithm: CompressKind | None = None,
@@ -104,10 +128,16 @@ def compress_stream(
     # models both codecs as BufferedIOBase, not IO[bytes], although
     # they implement its full surface (read / write / fileno / iteration).
     if algorithm == CompressKind.zst:
-        return _as_mode(cast(IO[bytes], ZstdFile(fh, "wb")), mode)
-    # mtime=0 keeps the output byte-identical across runs for identical
-    # payloads; the gzip header would otherwise embed the current time.
-    return _as_mode(cast(IO[bytes], GzipFile(fileobj=fh, mode="wb", mtime=0)), mode)
+        codec = ZstdFile(fh, "wb", options=_zstd_write_options())
+    else:
+        # mtime=0 keeps the output byte-identical across runs for identical
+        # payloads; the gzip header would otherwise embed the current time.
+        codec = GzipFile(fileobj=fh, mode="wb", mtime=0)
+    # exports write one small line at a time, and every codec ``write`` pays
+    # a checksum + compressor call; batch them into large chunks instead.
+    # Closing the buffer flushes it and then closes the codec (not ``fh``).
+    buffered = BufferedWriter(codec, WRITE_BUFFER_SIZE)  # type: ignore[arg-type]
+    return _as_mode(cast(IO[bytes], buffered), mode)
 
 
 def decompress_stream(
@@ -37,6 +37,21 @@ def _ts_str(value: str | datetime | None) -> str | None:
     return value
 
 
+PAYLOAD_COLUMNS = (
+    "entity_id",
+    "schema",
+    "dataset",
+    "origin",
+    "prop",
+    "value",
+    "first_seen",
+    "last_seen",
+)
+"""Statement columns :meth:`EntityPayload.to_dict` reads. Row sources feeding
+only ``to_dict`` can project to these and skip building the other keys of
+every row dict (:meth:`EntityPayload.to_entity` needs full rows)."""
+
+
 class EntityData(TypedDict):
     """All data needed to compile a proper EntityDict"""
 
@@ -83,35 +98,45 @@ class EntityPayload:
             properties=defaultdict(set),
         )
 
-        # collect statements
+        # collect statements – the per-statement loop is the hot path of
+        # every export, so the set methods are bound once up front
+        add_schema = data["schemata"].add
+        add_dataset = data["datasets"].add
+        add_origin = data["origins"].add
+        add_referent = data["referents"].add
+        add_first_seen = data["first_seens"].add
+        add_last_seen = data["last_seens"].add
+        add_last_change = data["last_changes"].add
+        properties = data["properties"]
+        own_id = self.id
         for s in self.statements:
-            data["schemata"].add(s["schema"])
-            data["datasets"].add(s["dataset"])
+            add_schema(s["schema"])
+            add_dataset(s["dataset"])
 
             origin = s.get("origin")
             if origin:
-                data["origins"].add(origin)
+                add_origin(origin)
 
             entity_id = s.get("entity_id")
-            if entity_id and entity_id != self.id:
-                data["referents"].add(entity_id)
+            if entity_id and entity_id != own_id:
+                add_referent(entity_id)
 
             first_seen = _ts_str(s.get("first_seen"))
-            last_seen = _ts_str(s.get("last_seen"))
 
             if s["prop"] == BASE_ID:
                 # last_change = max of BASE_ID statement first_seen values
                 if first_seen is not None:
-                    data["last_changes"].add(first_seen)
+                    add_last_change(first_seen)
             else:
-                data["properties"][s["prop"]].add(s["value"])
+                properties[s["prop"]].add(s["value"])
                 # first_seen/last_seen only from non-id statements
                 # (matches StatementEntity.to_context_dict which iterates _statements,
                 # which excludes BASE_ID)
                 if first_seen is not None:
-                    data["first_seens"].add(first_seen)
+                    add_first_seen(first_seen)
+                last_seen = _ts_str(s.get("last_seen"))
                 if last_seen is not None:
-                    data["last_seens"].add(last_seen)
+                    add_last_seen(last_seen)
 
         return data
 
@@ -16,6 +16,8 @@ for the two-branch fragment semantics.
 from datetime import datetime
 
 from deltalake import DeltaTable
+from sqlalchemy import Select
+from sqlalchemy.dialects import postgresql
 
 from ftm_lakehouse.core.settings import Settings
 from ftm_lakehouse.model.statement import TABLE_RAW
@@ -23,6 +25,13 @@ from ftm_lakehouse.util import validate_origin
 
 QUERY_IN_BATCH_SIZE = 5_000
 
+# DuckDB's SQL follows PostgreSQL (``ILIKE``, ``~`` regex, ``::`` casts), so
+# selects render with the postgres dialect – SQLAlchemy's default dialect
+# rewrites or rejects operators DuckDB supports natively. DuckDB string
+# literals treat backslashes literally, so the dialect must not double them.
+_DUCKDB_DIALECT = postgresql.dialect()
+_DUCKDB_DIALECT._backslash_escapes = False
+
 
 def duckdb_config() -> dict[str, str]:
     """LakeStore DuckDB config derived from lakehouse settings.
@@ -46,6 +55,19 @@ def duckdb_config() -> dict[str, str]:
     return config
 
 
+def compile_sql(q: Select) -> str:
+    """Render a SQLAlchemy select as executable DuckDB SQL.
+
+    Values are inlined via ``literal_binds`` so the string runs on a raw
+    DuckDB cursor (Arrow streaming), with the postgres dialect DuckDB's
+    SQL derives from – ftmq filters beyond equality (``__gt``, ``__like``,
+    ``__ilike``, ...) render as DuckDB understands them.
+    """
+    return str(
+        q.compile(dialect=_DUCKDB_DIALECT, compile_kwargs={"literal_binds": True})
+    )
+
+
 def _delta_scan_clause(dt: DeltaTable) -> str:
     """``delta_scan('<uri>')`` with the URI single-quote–escaped.
 
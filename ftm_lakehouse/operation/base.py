@@ -50,6 +50,14 @@ class DatasetJobOperation(BaseRepository, Generic[DJ]):
         """Return the dependencies. Override for dynamic values."""
         return self.dependencies
 
+    def is_latest(self, target: str, dependencies: list[str]) -> bool:
+        """Check if the `target` tag is newer than all `dependencies` tags.
+
+        Freshness check for handlers that decide on tags other than the
+        operation's own target, e.g. to reuse data of a previous run.
+        """
+        return self._tags.is_latest(target, dependencies)
+
     def handle(self, run: JobRun, *args, **kwargs) -> None:
         raise NotImplementedError
 
@@ -60,7 +68,7 @@ class DatasetJobOperation(BaseRepository, Generic[DJ]):
 
         if not force:
             if target and dependencies:
-                if self._tags.is_latest(target, dependencies):
+                if self.is_latest(target, dependencies):
                     self.job.log.info(
                         f"Already up-to-date: `{target}`, skipping ...",
                         target=target,
@@ -5,10 +5,12 @@ local or remote file stores into the lakehouse. This just adds (or replaces)
 documents but no processing. Use `ingest-file` or any other client for that.
 """
 
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime, timezone
 from enum import Enum
 from fnmatch import fnmatch
-from typing import Generator
+from hashlib import sha256
+from typing import Generator, Iterable, TypeAlias
 
 import aiohttp
 from anystore.store import get_store
@@ -16,11 +18,19 @@ from anystore.types import Uri
 from anystore.util import mask_uri
 from banal import ensure_dict
 
-from ftm_lakehouse.core.conventions import tag
+from ftm_lakehouse.core.conventions import path, tag
 from ftm_lakehouse.core.settings import CHECKSUM_ALGORITHM
 from ftm_lakehouse.model.job import DatasetJobModel
 from ftm_lakehouse.operation.base import DatasetJobOperation
 from ftm_lakehouse.repository.job import JobRun
+from ftm_lakehouse.storage.journal.base import BaseJournalWriter
+from ftm_lakehouse.util import make_data_checksum
+
+CRAWL_BATCH_SIZE = 1000
+"""Files per progress save – and per journal transaction for their entities."""
+
+Checksums: TypeAlias = dict[str, tuple[int, str, str]]
+"""Cached source checksums: key -> (size, mtime, checksum)"""
 
 
 class HandleExistingMode(str, Enum):
@@ -29,6 +39,9 @@ class HandleExistingMode(str, Enum):
     skip_checksum = "skip-checksum"
 
 
+SKIP_MODES = (HandleExistingMode.skip_path, HandleExistingMode.skip_checksum)
+
+
 class CrawlJob(DatasetJobModel):
     """
     Job model for crawl operations.
@@ -87,6 +100,12 @@ class CrawlOperation(DatasetJobOperation[CrawlJob]):
                 "timeout": aiohttp.ClientTimeout(total=3600 * 24),
             }
             self.source.backend_config = backend_config
+        self._cache = get_store(
+            self._store_uri, serialization_mode="json", raise_on_nonexist=False
+        )
+        self._checksums: Checksums = {}
+        self._stats: dict[str, tuple[int, str] | None] = {}
+        self._digest: str | None = None
 
     def get_uris(self) -> Generator[str, None, None]:
         """
@@ -109,7 +128,12 @@ class CrawlOperation(DatasetJobOperation[CrawlJob]):
             self.job.touch()
             yield key
 
-    def handle_crawl(self, uri: str, run: JobRun[CrawlJob]) -> datetime:
+    def handle_crawl(
+        self,
+        uri: str,
+        run: JobRun[CrawlJob],
+        writer: BaseJournalWriter | None = None,
+    ) -> datetime:
         """
         Handle a single crawl task.
 
@@ -118,6 +142,9 @@ class CrawlOperation(DatasetJobOperation[CrawlJob]):
         Args:
             uri: File uri to crawl
             run: Current job run context
+            writer: Journal writer for the file's entities (``make_entities``
+                jobs). Without one, they are added in a journal write of
+                their own.
 
         Returns:
             Timestamp when the task was processed
@@ -127,7 +154,7 @@ class CrawlOperation(DatasetJobOperation[CrawlJob]):
         self.log.info(f"Crawling `{uri}` ...", source=mask_uri(self.source.uri))
         checksum = None
         if self.source.is_local:
-            checksum = self.source.checksum(uri, algorithm=CHECKSUM_ALGORITHM)
+            checksum = self._checksum(uri)
         if not self._should_skip(uri, checksum):
             file = self.archive.store(
                 self.source.to_uri(uri),
@@ -136,22 +163,145 @@ class CrawlOperation(DatasetJobOperation[CrawlJob]):
                 origin=tag.CRAWL_ORIGIN,
             )
             if self.job.make_entities:
-                self.entities.add_many(file.make_entities(), tag.CRAWL_ORIGIN)
+                if writer is not None:
+                    for entity in file.make_entities():
+                        writer.add_entity(entity)
+                else:
+                    self.entities.add_many(file.make_entities(), tag.CRAWL_ORIGIN)
             run.job.done += 1
         return now
 
+    def _stat(self, uri: str) -> tuple[int, str] | None:
+        """Size and modification time of a local source file (``None`` if the
+        store reports no modification time)."""
+        if uri in self._stats:
+            return self._stats[uri]
+        info = self.source.info(uri)
+        if info.updated_at is None:
+            return None
+        return info.size, info.updated_at.isoformat()
+
+    def _checksum(self, uri: str) -> str:
+        """
+        Compute the checksum of a local source file.
+
+        A file whose size and modification time are unchanged since the
+        last crawl of this source reuses the cached checksum instead of
+        being read and hashed again.
+        """
+        stat = self._stat(uri)
+        if stat is not None:
+            cached = self._checksums.get(uri)
+            if cached is not None and cached[:2] == stat:
+                return cached[2]
+        checksum = self.source.checksum(uri, algorithm=CHECKSUM_ALGORITHM)
+        if stat is not None:
+            self._checksums[uri] = (*stat, checksum)
+        return checksum
+
+    def _files_digest(self, uris: list[str]) -> str | None:
+        """Digest over the (key, size, mtime) of the given source files, or
+        ``None`` if one of them has no modification time."""
+        self._stats = {uri: self._stat(uri) for uri in uris}
+        digest = sha256()
+        for uri, stat in sorted(self._stats.items()):
+            if stat is None:
+                return None
+            digest.update(f"{uri}\x00{stat[0]}\x00{stat[1]}\n".encode())
+        return digest.hexdigest()
+
+    def _source_digest(self, files: str) -> str:
+        """Digest of a crawl: its filters, the archive state and the source
+        files. If it matches the last completed crawl of this source, every
+        file would be skipped again."""
+        job = self.job.model_dump(
+            mode="json",
+            include={
+                "prefix",
+                "exclude_prefix",
+                "glob",
+                "exclude_glob",
+                "make_entities",
+                "existing",
+            },
+        )
+        archive_updated = self._tags.get(tag.ARCHIVE_UPDATED)
+        return make_data_checksum((job, str(archive_updated), files))
+
+    def _load_checksums(self) -> None:
+        data = self._cache.get(path.crawl_checksums(self.source.uri)) or {}
+        self._digest = data.get("digest")
+        files = data.get("files") or {}
+        self._checksums = {k: (s, m, c) for k, (s, m, c) in files.items()}
+
+    def _save_checksums(self, digest: str | None = None) -> None:
+        if self._checksums:
+            data = {"digest": digest, "files": self._checksums}
+            self._cache.put(path.crawl_checksums(self.source.uri), data)
+
+    def _writer(self) -> AbstractContextManager[BaseJournalWriter | None]:
+        if self.job.make_entities:
+            return self.entities.writer(tag.CRAWL_ORIGIN)
+        return nullcontext()
+
     def handle(self, run: JobRun, *args, **kwargs) -> None:
-        for ix, task in enumerate(self.get_uris(), 1):
-            if ix % 1000 == 0:
-                self.log.info(
-                    f"Handling task {ix} ...",
-                    pending=self.job.pending,
-                    done=self.job.done,
-                )
-                run.save()
-            self.handle_crawl(task, run)
-            run.job.pending -= 1
-            run.job.touch()
+        uris: Iterable[str] = self.get_uris()
+        files: str | None = None
+        if self.source.is_local:
+            self._load_checksums()
+            if self.job.existing in SKIP_MODES:
+                # stat the whole tree first: if nothing changed since the
+                # last completed crawl, neither did the outcome – every file
+                # would be skipped – so don't look at each one again
+                uris = list(uris)
+                files = self._files_digest(uris)
+                if files is not None and self._digest == self._source_digest(files):
+                    self.log.info(
+                        "Source unchanged since last crawl, skipping ...",
+                        source=mask_uri(self.source.uri),
+                    )
+                    run.job.pending = 0
+                    return
+        # Entities of a batch of files share one journal writer (one
+        # transaction) instead of one per file, and one archive tag write.
+        # The writer is committed with every progress save – and before a
+        # failing file's error is re-raised: the files archived before it in
+        # the batch are skipped by a re-run, so rolling back their entities
+        # would lose them.
+        # The checksum cache is written once, not per batch: rewriting the
+        # whole mapping for every batch would be quadratic on large trees.
+        tasks = enumerate(uris, 1)
+        exhausted = False
+        try:
+            while not exhausted:
+                exhausted = True
+                error: BaseException | None = None
+                with self.archive.bulk(), self._writer() as writer:
+                    try:
+                        for ix, task in tasks:
+                            self.handle_crawl(task, run, writer)
+                            run.job.pending -= 1
+                            run.job.touch()
+                            if ix % CRAWL_BATCH_SIZE == 0:
+                                exhausted = False
+                                break
+                    except BaseException as e:
+                        error = e  # leave the writer normally, commit first
+                if error is not None:
+                    raise error
+                if not exhausted:
+                    self.log.info(
+                        f"Handled {ix} tasks ...",
+                        pending=self.job.pending,
+                        done=self.job.done,
+                    )
+                    run.save()
+        except BaseException:
+            # keep what was hashed so far for the re-run
+            self._save_checksums()
+            raise
+        # only a completed crawl records its digest
+        self._save_checksums(self._source_digest(files) if files else None)
         if self.job.make_entities:
             self.entities.flush()
 
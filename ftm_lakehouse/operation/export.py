@@ -5,6 +5,11 @@ All exports run through a single :class:`ExportOperation` parameterized by
 :class:`ExportKind`. Per-kind behavior lives in the :data:`EXPORTS` spec
 table – adding a new export means adding a handler function and a spec
 entry, not a new job / operation / factory triple.
+
+The Delta/parquet statement store is the only source the exports compute
+from: ``statistics.json`` aggregates the parquet store directly, it never
+re-parses ``statements.csv``. The CSV is a publication artifact (plus a fast
+pre-sorted input for the ``entities`` export when it is fresh).
 """
 
 from dataclasses import dataclass
@@ -104,26 +109,37 @@ def _export_index(
     public_prefix = dataset.get_public_prefix()
 
     if public_prefix:
+        # resources of the current index, to skip re-hashing unchanged files
+        current = op._versions.get(
+            path.INDEX, dataset.__class__, raise_on_nonexist=False
+        )
+        published = {r.url: r for r in current.resources} if current else {}
         entities = get_entities(dataset.name, dataset.uri)
-        if store.exists(entities.EXPORTS_STATEMENTS):
-            uri = join_uri(dataset.uri, entities.EXPORTS_STATEMENTS)
-            public_url = join_uri(public_prefix, entities.EXPORTS_STATEMENTS)
-            dataset.resources.append(make_statements_resource(uri, public_url))
-
-        if store.exists(entities.ENTITIES_JSON):
-            uri = join_uri(dataset.uri, entities.ENTITIES_JSON)
-            public_url = join_uri(public_prefix, entities.ENTITIES_JSON)
-            dataset.resources.append(make_entities_resource(uri, public_url))
-
-        if store.exists(path.EXPORTS_DOCUMENTS):
-            uri = join_uri(dataset.uri, path.EXPORTS_DOCUMENTS)
-            public_url = join_uri(public_prefix, path.EXPORTS_DOCUMENTS)
-            dataset.resources.append(make_documents_resource(uri, public_url))
-
-        if store.exists(path.EXPORTS_STATISTICS):
-            uri = join_uri(dataset.uri, path.EXPORTS_STATISTICS)
-            public_url = join_uri(public_prefix, path.EXPORTS_STATISTICS)
-            dataset.resources.append(make_statistics_resource(uri, public_url))
+        for key, target, make_resource in (
+            (
+                entities.EXPORTS_STATEMENTS,
+                path.EXPORTS_STATEMENTS,
+                make_statements_resource,
+            ),
+            (entities.ENTITIES_JSON, path.ENTITIES_JSON, make_entities_resource),
+            (path.EXPORTS_DOCUMENTS, path.EXPORTS_DOCUMENTS, make_documents_resource),
+            (
+                path.EXPORTS_STATISTICS,
+                path.EXPORTS_STATISTICS,
+                make_statistics_resource,
+            ),
+        ):
+            if store.exists(key):
+                uri = join_uri(dataset.uri, key)
+                public_url = join_uri(public_prefix, key)
+                # an artifact not exported again since the current index was
+                # built still has the checksum published there – decided by
+                # the export tags, not by file timestamps, which are coarse
+                # or missing on some backends
+                previous = None
+                if op.is_latest(path.INDEX, [target]):
+                    previous = published.get(public_url)
+                dataset.resources.append(make_resource(uri, public_url, previous))
 
     if store.exists(path.EXPORTS_STATISTICS):
         dataset.apply_stats(store.get(path.EXPORTS_STATISTICS, model=DatasetStats))
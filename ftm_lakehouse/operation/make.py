@@ -6,19 +6,59 @@ from ftm_lakehouse.operation.base import DatasetJobOperation
 from ftm_lakehouse.operation.export import ExportJob, ExportKind, ExportOperation
 from ftm_lakehouse.repository.job import JobRun
 
+MAKE_EXPORTS: tuple[ExportKind, ...] = (
+    ExportKind.statements,
+    ExportKind.statistics,
+    ExportKind.entities,
+    ExportKind.documents,
+    ExportKind.index,
+)
+"""Every export of a full make run, in run order. ``entities`` reads the
+fresh ``statements.csv`` instead of scanning parquet, so ``statements`` runs
+first; ``index`` reads the other artifacts and comes last."""
+
 
 class MakeJob(DatasetJobModel):
     pass
 
 
 class MakeOperation(DatasetJobOperation[MakeJob]):
+    """Flush the journal, then run every export in :data:`MAKE_EXPORTS`.
+
+    What each export reads:
+
+    - ``statements``: a sorted scan of the parquet store.
+    - ``statistics``: aggregate queries over the parquet store.
+    - ``entities``: the fresh ``statements.csv`` (see
+      :meth:`~ftm_lakehouse.repository.entities.EntityRepository.export_entities`),
+      parquet only when that is stale; the diff queries the statements
+      changed since the last export.
+    - ``documents``: a document count, then the folder paths and the
+      document rows from parquet; the diff queries the changed
+      ``contentHash`` statements.
+    - ``index``: the other artifacts (file info, ``statistics.json``) and the
+      current ``index.json``, no parquet.
+
+    Each export checks its own freshness tags, so an up-to-date artifact is
+    skipped without reading anything.
+    """
+
     target = tag.OP_MAKE
     dependencies = [tag.JOURNAL_UPDATED, tag.STATEMENTS_UPDATED]
 
+    def _run_local(self, force: bool | None = False, *args, **kwargs) -> MakeJob:
+        # Flush *before* the freshness check: the flush bumps
+        # ``statements/last_updated``, and doing it inside the run would
+        # leave that tag newer than this run's start timestamp, so the next
+        # make would re-run just to find every export fresh.
+        self.entities.flush()
+        return super()._run_local(force, *args, **kwargs)
+
     def handle(self, run: JobRun, *args, **kwargs) -> None:
         force = kwargs.get("force", False)
-        self.entities.flush()
-        for kind in ExportKind:
+        # one after another: the exports share this dataset's cached
+        # repositories and their DuckDB connection
+        for kind in MAKE_EXPORTS:
             job = ExportJob.make(dataset=self.dataset, kind=kind)
             ExportOperation(job, self.uri).run(force=force)
         run.job.done = 1
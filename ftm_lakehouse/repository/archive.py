@@ -1,8 +1,10 @@
 """ArchiveRepository - file archive operations using content-addressed blob
 storage, JSON metadata, and optional extracted fulltext."""
 
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import IO, Any, BinaryIO, ContextManager
+from typing import IO, Any, BinaryIO, ContextManager, Generator, Self
 
 from anystore.io.read import open_virtual
 from anystore.logic.constants import CHUNK_SIZE_LARGE, DEFAULT_MODE
@@ -58,6 +60,10 @@ class ArchiveRepository(BaseRepository):
         self._txts = get_store(
             self._store_uri, serialization_mode="auto", raise_on_nonexist=False
         )
+        # per-thread bulk state: the repository is cached process-wide
+        # (``get_archive``), so one thread's bulk block must not defer (or
+        # swallow) another thread's tag write
+        self._bulk = threading.local()
 
     def exists(self, checksum: str) -> bool:
         """Check if blob exists for the given checksum."""
@@ -172,8 +178,11 @@ class ArchiveRepository(BaseRepository):
 
         # Store metadata
         self._files.put(file.meta_path, file)
-        # Notify archive was updated
-        self._tags.set(tag.ARCHIVE_UPDATED)
+        # Notify archive was updated (once per bulk block)
+        if getattr(self._bulk, "depth", 0):
+            self._bulk.updated = True
+        else:
+            self._tags.set(tag.ARCHIVE_UPDATED)
 
         self.log.info(
             f"Archived `{file.key} ({file.checksum})`",
@@ -182,6 +191,32 @@ class ArchiveRepository(BaseRepository):
 
         return file
 
+    @contextmanager
+    def bulk(self) -> Generator[Self, None, None]:
+        """
+        Archive many files with a single ``ARCHIVE_UPDATED`` tag write.
+
+        :meth:`store` stamps the archive tag for every file. Within this
+        context the stamp is deferred and written once when the outermost
+        block exits – also on error, so the files archived until then are
+        never missed by freshness checks. The deferral is per thread: stores
+        from other threads sharing this repository still stamp immediately.
+
+        Usage:
+            with archive.bulk():
+                for uri in uris:
+                    archive.store(uri)
+        """
+        state = self._bulk
+        state.depth = getattr(state, "depth", 0) + 1
+        try:
+            yield self
+        finally:
+            state.depth -= 1
+            if not state.depth and getattr(state, "updated", False):
+                state.updated = False
+                self._tags.set(tag.ARCHIVE_UPDATED)
+
     def store_blob(self, uri: Uri, checksum: str | None = None) -> str:
         """
         Store bytes blob from given uri if it doesn't exist yet.
@@ -235,6 +270,7 @@ class ArchiveRepository(BaseRepository):
             file_id=file.id,
         )
         self._files.delete(file.meta_path)
+        self._tags.set(tag.ARCHIVE_UPDATED)
 
     def put_txt(self, checksum: str, text: str, origin: str = DEFAULT_ORIGIN) -> None:
         """Store extracted text for a file.
@@ -3,7 +3,7 @@ from typing import Any
 import orjson
 from followthemoney import StatementEntity
 from ftmq.model.stats import DatasetStats
-from ftmq.query import Query
+from ftmq.query import M, Query
 from ftmq.store.lake import LakeStatement
 from ftmq.types import StatementEntities, Statements
 from ftmq.util import ensure_entity
@@ -70,6 +70,35 @@ class ApiEntityRepository(LakehouseApiMixin):
         for line in self._api.stream_request(url, "POST", json=data):
             yield ensure_entity(orjson.loads(line), StatementEntity)
 
+    @require_api
+    def _api_count(
+        self,
+        q: Query | None = None,
+        *,
+        flush_first: bool = False,
+        origin: str | None = None,
+    ) -> int:
+        url = self._make_url("count")
+        data = {
+            "flush_first": flush_first,
+            "origin": origin,
+            **_serialize_query(q),
+        }
+        res = self._api.make_request(url, "POST", json=data)
+        return int(res.text)
+
+    @require_api
+    def _api_get(
+        self,
+        entity_id: str,
+        origin: str | None = None,
+        flush_first: bool = False,
+    ) -> StatementEntity | None:
+        q = Query().where(M(entity_id=entity_id))
+        for entity in self._api_query(q, flush_first=flush_first, origin=origin):
+            return entity
+        return None
+
     @require_api
     def _api_query_statements(
         self, q: Query | None = None, origin: str | None = None
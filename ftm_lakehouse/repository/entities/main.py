@@ -1,6 +1,5 @@
 """EntityRepository - entity/statement operations using JournalStore + ParquetStore."""
 
-import csv
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import IO, Generator, Iterable, Iterator, cast
@@ -13,7 +12,7 @@ from anystore.util import Took, mask_uri
 from followthemoney import EntityProxy, Statement, StatementEntity
 from ftmq.io import smart_read_proxies
 from ftmq.model.stats import DatasetStats
-from ftmq.query import M, Query
+from ftmq.query import Query
 from ftmq.store.lake import LakeStatement, pack_statement
 from ftmq.types import StatementEntities, Statements, ValueEntities
 from sqlalchemy import select
@@ -22,9 +21,9 @@ from ftm_lakehouse.core.api import api_delegate, no_api
 from ftm_lakehouse.core.conventions import path, tag
 from ftm_lakehouse.core.settings import Settings
 from ftm_lakehouse.exceptions import MalformedStatementError
-from ftm_lakehouse.helpers.statements import unpack_statement
+from ftm_lakehouse.helpers.statements import stream_csv_rows, unpack_statement
 from ftm_lakehouse.logic.compress import compress_stream, decompress_stream
-from ftm_lakehouse.logic.entities.aggregate import aggregate_unsafe
+from ftm_lakehouse.logic.entities.aggregate import PAYLOAD_COLUMNS, aggregate_unsafe
 from ftm_lakehouse.model.statement import SHARDED_SCHEMA, StatementRow
 from ftm_lakehouse.repository.base import BaseRepository
 from ftm_lakehouse.repository.diff import ParquetDiffMixin, make_envelope
@@ -44,6 +43,14 @@ before :meth:`EntityRepository.write_statements` emits.
 """
 
 
+JOURNAL_MAX_ROWS = 1_000_000
+"""Journal size at which a writer context drains it into parquet."""
+
+JOURNAL_CHECK_ROWS = 10_000
+"""Rows written between two journal size checks against
+:data:`JOURNAL_MAX_ROWS`."""
+
+
 class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
     """
     Repository for entity/statement operations.
@@ -83,6 +90,7 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
         self._statements = ParquetStore(uri, dataset, self.shards, self.compression)
         self.ENTITIES_JSON = path.entities_json(self.compression)
         self.EXPORTS_STATEMENTS = path.exports_statements(self.compression)
+        self._unchecked_rows = 0
 
     @contextmanager
     def writer(
@@ -91,9 +99,18 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
         """
         Get a bulk writer for adding entities/statements.
 
+        ``origin`` is only the writer's default: ``add_entity`` and
+        ``add_statement`` accept a per-call ``origin=`` override, so rows of
+        several origins can go through a single writer – one journal
+        transaction instead of one per origin.
+
         Usage:
             with repo.writer(origin="import") as writer:
                 writer.add_entity(entity)
+
+            with repo.writer() as writer:
+                writer.add_entity(entity_a, origin="source_a")
+                writer.add_entity(entity_b, origin="source_b")
         """
         with self._tags.touch(tag.JOURNAL_UPDATED):
             writer = self._journal.writer(self.shards, origin)
@@ -106,9 +123,13 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
                 writer.flush()
             finally:
                 writer.close()
-                # keep journal not too full
-                if self._journal.count() >= 1_000_000:
-                    self.flush()
+                # keep journal not too full – counting it is a query of its
+                # own, so don't pay it on every small add()
+                self._unchecked_rows += writer.written
+                if self._unchecked_rows >= JOURNAL_CHECK_ROWS:
+                    self._unchecked_rows = 0
+                    if self._journal.count() >= JOURNAL_MAX_ROWS:
+                        self.flush()
 
     def add(
         self,
@@ -128,7 +149,7 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
         """Add an entity iterator to the journal."""
         with self.writer(origin) as writer:
             for entity in entities:
-                writer.add_entity(entity, fragment)
+                writer.add_entity(entity, fragment=fragment)
 
     @api_delegate("_api_flush")
     def flush(self) -> int:
@@ -166,6 +187,17 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
 
             return total
 
+    def _flush_if_dirty(self) -> None:
+        """Flush only when the journal changed since the last flush.
+
+        Compares the ``journal/last_flushed`` and ``journal/last_updated``
+        tags – the same freshness check export runs use – so repeated
+        ``flush_first`` reads after a single write skip the journal count
+        and the flush entirely.
+        """
+        if not self._tags.is_latest(tag.JOURNAL_FLUSHED, [tag.JOURNAL_UPDATED]):
+            self.flush()
+
     @no_api
     def write_statements(
         self,
@@ -260,6 +292,8 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
             total += len(batch)
             buffer.clear()
 
+        # per-row hot loop over millions of rows: bind the append once
+        append = buffer.append
         for data in rows:
             shard = data["shard"]
             if current_shard is not None and current_shard != shard:
@@ -268,7 +302,7 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
                 if len(buffer) >= batch_size:
                     _emit()
             current_shard = shard
-            buffer.append(data)
+            append(data)
 
         _emit()
         return total
@@ -303,7 +337,8 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
 
         Args:
             q: ftmq ``Query`` of entity-level filters (schema, properties, ...).
-            flush_first: Flush the journal to parquet before querying.
+            flush_first: Flush the journal to parquet before querying, if
+                it was written to since the last flush.
             origin: Restrict to statements of this origin – a storage-level row
                 filter, so an assembled entity carries only that origin's
                 statements.
@@ -312,9 +347,36 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
             StatementEntity objects matching the query.
         """
         if flush_first:
-            self.flush()
+            self._flush_if_dirty()
         yield from self._statements.query(q, origin=origin)
 
+    @api_delegate("_api_count")
+    def count(
+        self,
+        q: Query | None = None,
+        *,
+        flush_first: bool = False,
+        origin: str | None = None,
+    ) -> int:
+        """Count entities in the parquet store without assembling them.
+
+        A single aggregate in the store (:meth:`ParquetStore.count`) instead
+        of materializing every entity via :meth:`query` just to take the
+        length. Slicing (``q[:n]``) is not applied to the count.
+
+        Args:
+            q: ftmq ``Query`` of entity-level filters (schema, properties, ...).
+            flush_first: Flush the journal to parquet before counting, if
+                it was written to since the last flush.
+            origin: Only count entities with statements of this origin.
+
+        Returns:
+            Number of distinct matching entities.
+        """
+        if flush_first:
+            self._flush_if_dirty()
+        return self._statements.count(q, origin=origin)
+
     @api_delegate("_api_query_statements")
     def query_statements(
         self, q: Query | None = None, origin: str | None = None
@@ -331,17 +393,22 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
         """
         yield from self._statements.query_statements(q, origin=origin)
 
+    @api_delegate("_api_get")
     def get(
         self,
         entity_id: str,
         origin: str | None = None,
         flush_first: bool = False,
     ) -> StatementEntity | None:
-        """Get a single entity by ID."""
-        q = Query().where(M(entity_id=entity_id))
-        for entity in self.query(q, flush_first=flush_first, origin=origin):
-            return entity
-        return None
+        """Get a single entity by ID.
+
+        A point lookup: the entity's shard is derived from its id, so only
+        that shard's partitions are read (see
+        :meth:`ParquetStore.get_statements`).
+        """
+        if flush_first:
+            self._flush_if_dirty()
+        return self._statements.get(entity_id, origin=origin)
 
     def stream(self) -> ValueEntities:
         """
@@ -350,6 +417,9 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
         This reads from the pre-exported entities.ftm.json file,
         not directly from the parquet store – decoded with the dataset's
         codec, since that artifact is written compressed when configured.
+        Lines are parsed by ftmq's reader (orjson under the hood), reading
+        forward through the codec stream, so the file is never mapped or
+        loaded whole.
         """
         if self._store.exists(self.ENTITIES_JSON):
             with (
@@ -407,17 +477,18 @@ class EntityRepository(ParquetDiffMixin, BaseRepository, ApiEntityRepository):
         Applies the dataset's codec on the way in: the CSV this reads is the
         artifact :meth:`ParquetStore.export_csv` just wrote, so on a
         compressed dataset it is a codec frame – and anystore's
-        ``smart_stream_csv`` opens in text mode with no notion of
-        compression. ``mode="r"`` asks for the text stream
-        :class:`csv.DictReader` needs; an uncompressed dataset takes the same
-        path, so there is no branch here.
+        ``smart_stream_csv`` has no notion of compression. The decoded bytes
+        are parsed columnar by :func:`stream_csv_rows`; an uncompressed
+        dataset takes the same path, so there is no branch here. Only the
+        :data:`~ftm_lakehouse.logic.entities.aggregate.PAYLOAD_COLUMNS` the
+        entity export consumes are read.
         """
         with (
             # anystore types the handle as IO[Never] without a mode binding
             smart_open(uri, "rb") as fh,
-            decompress_stream(cast(IO[bytes], fh), self.compression, "r") as raw,
+            decompress_stream(cast(IO[bytes], fh), self.compression) as raw,
         ):
-            yield from csv.DictReader(raw)
+            yield from stream_csv_rows(raw, PAYLOAD_COLUMNS)
 
     def _fresh_statements_csv(self) -> str | None:
         """URI of the exported ``statements.csv`` if it's current, else ``None``.
@@ -53,12 +53,15 @@ class BaseJournalWriter(EntityBuffer, Generic[S]):
     def __init__(self, store: S, shards: int, origin: str | None = None) -> None:
         super().__init__(store.dataset, shards, origin)
         self.store = store
+        # rows handed to the journal by this writer so far
+        self.written: int = 0
 
     def _upsert_batch(self) -> None:
         raise NotImplementedError
 
     def flush_rows(self) -> JournalRows:
         for row in self.flush_buffer():
+            self.written += 1
             yield JournalRow(
                 row.stmt.id,
                 row.shard,
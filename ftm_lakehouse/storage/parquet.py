@@ -38,9 +38,10 @@ Layout:
 
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Callable, Iterator, cast
+from typing import Any, Callable, Iterator, cast
 from uuid import uuid4
 
 import pyarrow as pa
@@ -67,7 +68,10 @@ from ftmq.store.lake import (
 )
 from ftmq.types import StatementEntities, Statements
 from ftmq.util import make_dataset
-from pyarrow.csv import CSVWriter  # type: ignore[attr-defined]  # missing from stubs
+from pyarrow.csv import (  # type: ignore[attr-defined]  # missing from stubs
+    CSVWriter,
+    WriteOptions,
+)
 from sqlalchemy import Select, column, or_, select
 
 from ftm_lakehouse.core.api import LakehouseApiMixin, no_api
@@ -79,6 +83,7 @@ from ftm_lakehouse.logic.entities.aggregate import EntityPayload
 from ftm_lakehouse.logic.parquet import (
     build_changed_sql,
     build_merge_sql,
+    compile_sql,
     duckdb_config,
     live_view_sql,
     raw_view_sql,
@@ -94,6 +99,15 @@ from ftm_lakehouse.storage.tags import TagStore
 
 PARTITIONS = ["shard", "bucket", "origin"]
 
+CSV_WRITE_BATCH_SIZE = 65_536
+"""Rows the Arrow CSV writer formats per chunk (pyarrow's default is 1024)."""
+
+SQL_BATCH_SIZE = 10_000
+"""Rows per Arrow batch when streaming raw-SQL results into Python dicts."""
+
+TAG_WRITE_WORKERS = 8
+"""Concurrent partition tag writes issued by :meth:`ParquetStore.append`."""
+
 STATEMENT_SOURCE = SqlSource(
     TABLE,
     id_column="entity_id",
@@ -109,6 +123,25 @@ partition-prune predicate on every compiled query (ftmq's
 ``ensure_schema_buckets`` helper and the ``Query.table`` mutation."""
 
 
+_STORAGE_OPTIONS: dict[str, Any] | None = None
+"""The object-storage options DuckDB was last configured with."""
+
+
+def ensure_duckdb_storage() -> None:
+    """Configure DuckDB's object-storage access when its options changed.
+
+    Every :class:`ParquetStore` needs it, but the setup is global – repeated
+    repository construction (many datasets, test suites) only pays it again
+    when the storage options (endpoint, credentials, ...) differ from the
+    last setup.
+    """
+    global _STORAGE_OPTIONS
+    options = storage_options()
+    if options != _STORAGE_OPTIONS:
+        setup_duckdb_storage()
+        _STORAGE_OPTIONS = options
+
+
 class ParquetStore(LakehouseApiMixin):
     """Single Delta Lake table (per dataset) partitioned by ``(shard, bucket,
     origin)``.
@@ -153,7 +186,7 @@ class ParquetStore(LakehouseApiMixin):
             dataset=self.dataset,
             uri=mask_uri(self.uri),
         )
-        setup_duckdb_storage()
+        ensure_duckdb_storage()
 
     @property
     def deltatable(self) -> DeltaTable:
@@ -176,9 +209,10 @@ class ParquetStore(LakehouseApiMixin):
         return self._lake.default_view()
 
     @no_api
-    def get(self, entity_id: str) -> StatementEntity | None:
-        """Lookup an Entity by its ID"""
-        stmts = list(self.get_statements(entity_id))
+    def get(self, entity_id: str, origin: str | None = None) -> StatementEntity | None:
+        """Lookup an Entity by its ID, optionally restricted to one origin's
+        statements"""
+        stmts = list(self.get_statements(entity_id, origin=origin))
         if stmts:
             return StatementEntity.from_statements(make_dataset(self.dataset), stmts)
 
@@ -244,7 +278,7 @@ class ParquetStore(LakehouseApiMixin):
             for data in aggregate_unsafe(rows, self.dataset):
                 yield data.to_entity()
         else:
-            for data in self._query_data(sel):
+            for data in self._query_data(sel, origin=origin):
                 yield data.to_entity()
 
     @no_api
@@ -270,11 +304,11 @@ class ParquetStore(LakehouseApiMixin):
             for stmt_dict in self._global_statement_data(sel):
                 yield LakeStatement.from_dict(stmt_dict)
         else:
-            for stmt_dict in self._query_statement_data(sel):
+            for stmt_dict in self._query_statement_data(sel, origin=origin):
                 yield LakeStatement.from_dict(stmt_dict)
 
     @no_api
-    def get_statements(self, entity_id: str) -> Statements:
+    def get_statements(self, entity_id: str, origin: str | None = None) -> Statements:
         """Query all live statements for a single entity.
 
         Scopes :meth:`_query_statement_data` iteration to the entity's
@@ -282,13 +316,17 @@ class ParquetStore(LakehouseApiMixin):
         ``(shard, bucket)`` pair. Yields
         :class:`ftmq.store.lake.LakeStatement` so the ``fragment`` group
         key stays visible – tombstone writers rely on it so a delete
-        lands in the same supersession group as the live row.
+        lands in the same supersession group as the live row. ``origin``
+        restricts to that origin's statements (and partitions).
         """
         if not self.exists:
             return
         shard = path.entity_shard(entity_id, self.shards)
         q = select(TABLE).where(TABLE.c.shard == shard, TABLE.c.entity_id == entity_id)
-        for stmt_dict in self._query_statement_data(q, shard=shard):
+        if origin is not None:
+            q = q.where(TABLE.c.origin == origin)
+        rows = self._query_statement_data(q, shard=shard, origin=origin)
+        for stmt_dict in rows:
             yield LakeStatement.from_dict(stmt_dict)
 
     @no_api
@@ -304,7 +342,39 @@ class ParquetStore(LakehouseApiMixin):
         return self._lake.default_view().stats()
 
     @no_api
-    def count(self, q: Query | None = None) -> int:
+    def partition_stats(self) -> pa.Table:
+        """Physical per-partition counters from the Delta transaction log.
+
+        Aggregates the ``add`` actions of the current table version – no
+        parquet file is opened and no DuckDB query runs, so this is cheap
+        regardless of the store size. Counts are *physical*: pre-merge
+        duplicates and tombstones are included (use :meth:`stats` for the
+        logical, entity-level statistics).
+
+        Returns:
+            Table with the columns ``shard``, ``bucket``, ``origin``,
+            ``files``, ``rows`` and ``size`` (bytes), one row per partition.
+        """
+        keys = [f"partition.{p}" for p in PARTITIONS]
+        if not self.exists:
+            schema = pa.schema(
+                [(p, pa.string()) for p in PARTITIONS]
+                + [(c, pa.int64()) for c in ("files", "rows", "size")]
+            )
+            return schema.empty_table()
+        actions = pa.table(
+            pa.record_batch(self.deltatable.get_add_actions(flatten=True))
+        )
+        stats = actions.group_by(keys).aggregate(
+            [("path", "count"), ("num_records", "sum"), ("size_bytes", "sum")]
+        )
+        stats = stats.select(
+            [*keys, "path_count", "num_records_sum", "size_bytes_sum"]
+        ).rename_columns([*PARTITIONS, "files", "rows", "size"])
+        return stats.sort_by([(p, "ascending") for p in PARTITIONS])
+
+    @no_api
+    def count(self, q: Query | None = None, origin: str | None = None) -> int:
         """Count distinct entities matching ``q``.
 
         A single ``count(DISTINCT entity_id)`` aggregate (not the
@@ -312,13 +382,17 @@ class ParquetStore(LakehouseApiMixin):
         export that would otherwise iterate every partition for zero results.
         Compiled through :data:`STATEMENT_SOURCE`, so a schema filter folds into
         the same ``bucket IN (...)`` prune as :meth:`compile_query` –
-        non-matching partitions are pruned, not just file-skipped. Like the
+        non-matching partitions are pruned, not just file-skipped. ``origin``
+        adds the storage-level row filter :meth:`query` takes. Like the
         other aggregates it assumes an optimized store.
         """
         if not self.exists:
             return 0
         q = q or Query()
-        for row in self._lake._execute(Sql(q, STATEMENT_SOURCE).count):
+        sel = Sql(q, STATEMENT_SOURCE).count
+        if origin is not None:
+            sel = sel.where(column("origin") == origin)
+        for row in self._lake._execute(sel):
             for value in row:
                 return int(value)
         return 0
@@ -558,15 +632,28 @@ class ParquetStore(LakehouseApiMixin):
         (one harmless extra merge), never committed data in a
         clean-looking partition that merge would skip forever (reads
         depend on merge for correctness, so a permanently skipped
-        partition would surface duplicates indefinitely).
+        partition would surface duplicates indefinitely). The tag writes are
+        issued concurrently and all complete before the Delta commits.
         """
         partitions = batch.select(PARTITIONS).group_by(PARTITIONS).aggregate([])
-        for shard, bucket, origin in zip(
-            partitions["shard"].to_pylist(),
-            partitions["bucket"].to_pylist(),
-            partitions["origin"].to_pylist(),
-        ):
-            self._tags.set(tag.statements_partition_updated(shard, bucket, origin))
+        keys = [
+            tag.statements_partition_updated(shard, bucket, origin)
+            for shard, bucket, origin in zip(
+                partitions["shard"].to_pylist(),
+                partitions["bucket"].to_pylist(),
+                partitions["origin"].to_pylist(),
+            )
+        ]
+        if len(keys) < 2:
+            for key in keys:
+                self._tags.set(key)
+            return
+        # One small put per partition: on a remote store these are
+        # latency-bound round-trips, so submit them all and wait once
+        # instead of paying them serially.
+        now = datetime.now(timezone.utc)
+        with ThreadPoolExecutor(min(TAG_WRITE_WORKERS, len(keys))) as pool:
+            list(pool.map(lambda key: self._tags.set(key, now), keys))
 
     @no_api
     def merge(self, grace_period_days: int | None = None, force: bool = False) -> None:
@@ -688,12 +775,23 @@ class ParquetStore(LakehouseApiMixin):
         files into larger ones; it does not collapse duplicate rows or drop
         tombstones (use :meth:`merge` for that). Held under the exclusive
         maintenance fence (:meth:`_maintenance_fence`).
+
+        Each ``OPTIMIZE`` call is scoped to one partition via
+        ``partition_filters``, and partitions that already consist of a
+        single file (per the Delta log, no data scan) are skipped – there is
+        nothing to bin-pack there.
         """
         if not self.exists:
             return
         with self._maintenance_fence():
             with Took() as t:
-                for shard, bucket, origin in self._list_partitions():
+                compacted = skipped = 0
+                for partition in self.partition_stats().to_pylist():
+                    shard, bucket, origin = (partition[p] for p in PARTITIONS)
+                    if partition["files"] < 2:
+                        skipped += 1
+                        continue
+                    compacted += 1
                     self.deltatable.optimize.compact(
                         partition_filters=[
                             ("shard", "=", shard),
@@ -703,7 +801,9 @@ class ParquetStore(LakehouseApiMixin):
                         writer_properties=writer_for_bucket(bucket),
                         target_size=TARGET_SIZE,
                     )
-            self.log.info("Compaction done.", took=t.took)
+            self.log.info(
+                "Compaction done.", took=t.took, compacted=compacted, skipped=skipped
+            )
 
     @no_api
     def vacuum(self, retention_hours: int = 0) -> None:
@@ -735,7 +835,9 @@ class ParquetStore(LakehouseApiMixin):
         Streams each ``(shard, bucket)`` partition straight from DuckDB as
         Arrow batches (:meth:`_execute_partitioned`) into a ``pyarrow`` CSV
         writer, so the export stays vectorised end to end – no per-row
-        Python materialisation. Memory stays bounded per batch and the
+        Python materialisation. The writer formats
+        :data:`CSV_WRITE_BATCH_SIZE` rows per chunk, amortising its per-chunk
+        overhead across large batches. Memory stays bounded per batch and the
         ``ORDER BY entity_id`` sort stays bounded to one partition.
 
         Compression comes from :attr:`compression` (the dataset's config), not
@@ -750,6 +852,7 @@ class ParquetStore(LakehouseApiMixin):
             return
         if q is None:
             q = statement_csv_select()
+        options = WriteOptions(batch_size=CSV_WRITE_BATCH_SIZE)
         with (
             self._store.open(key, "wb") as fh,
             compress_stream(fh, self.compression) as out,
@@ -758,7 +861,7 @@ class ParquetStore(LakehouseApiMixin):
             for reader in self._execute_partitioned(q):
                 for batch in reader:
                     if writer is None:
-                        writer = CSVWriter(out, batch.schema)
+                        writer = CSVWriter(out, batch.schema, write_options=options)
                     writer.write(batch)
             if writer is not None:
                 writer.close()
@@ -834,7 +937,7 @@ class ParquetStore(LakehouseApiMixin):
         return [(s, b, o) for s, b, o in rows]
 
     def _iter_shard_buckets(
-        self, shard: str | None = None
+        self, shard: str | None = None, origin: str | None = None
     ) -> Iterator[tuple[str, str]]:
         """Yield unique ``(shard, bucket)`` pairs from existing partitions.
 
@@ -850,11 +953,17 @@ class ParquetStore(LakehouseApiMixin):
             shard: Optional shard filter. When given, only ``(shard,
                 bucket)`` pairs for that shard are yielded – lets
                 single-entity lookups skip the other shards.
+            origin: Optional origin filter. ``origin`` is a partition column,
+                so ``(shard, bucket)`` pairs holding no partition of that
+                origin can't match an origin-filtered read and are skipped
+                without issuing a query.
         """
         seen: set[tuple[str, str]] = set()
-        for s, b, _origin in self._list_partitions():
+        for s, b, o in self._list_partitions():
             if shard is not None and s != shard:
                 continue
+            if origin is not None and o != origin:
+                continue
             key = (s, b)
             if key not in seen:
                 seen.add(key)
@@ -889,12 +998,16 @@ class ParquetStore(LakehouseApiMixin):
             q = self.compile_query()
         for s, b in self._iter_shard_buckets(shard=shard):
             scoped = q.where(column("shard") == s, column("bucket") == b)
-            sql = str(scoped.compile(compile_kwargs={"literal_binds": True}))
+            sql = compile_sql(scoped)
             with self._lake.cursor() as cur:
                 yield cur.execute(sql).to_arrow_reader()
 
     def _query_statement_data(
-        self, q: Select | None = None, *, shard: str | None = None
+        self,
+        q: Select | None = None,
+        *,
+        shard: str | None = None,
+        origin: str | None = None,
     ) -> Iterator[StatementDict]:
         """Query statement dicts from the live view, bypassing FtM construction.
 
@@ -908,35 +1021,47 @@ class ParquetStore(LakehouseApiMixin):
         store this can surface duplicate ids and rows whose delete has not been
         applied yet.
 
+        Each partition's result streams as Arrow batches through
+        :meth:`_execute_sql` and is decoded to dicts a batch at a time,
+        instead of materializing a result row object per statement first.
+
         Args:
             q: Optional SQLAlchemy select (default: :meth:`compile_query`).
             shard: Optional shard filter passed through to
                 :meth:`_iter_shard_buckets` to scope iteration to one shard –
                 used by single-entity lookups.
+            origin: Optional origin passed through to
+                :meth:`_iter_shard_buckets` to skip partitions without it.
+                Only prunes the iteration – ``q`` must carry the matching
+                ``origin`` row filter itself.
 
         Yields:
             StatementDict instances.
         """
         if q is None:
             q = self.compile_query()
-        for s, b in self._iter_shard_buckets(shard=shard):
+        for s, b in self._iter_shard_buckets(shard=shard, origin=origin):
             scoped = q.where(column("shard") == s, column("bucket") == b)
-            for row in self._lake._execute(scoped):
-                yield StatementDict(**vars(row))
+            sql = compile_sql(scoped)
+            yield from self._execute_sql(sql)
 
-    def _query_data(self, q: Select | None = None) -> Iterator[EntityPayload]:
+    def _query_data(
+        self, q: Select | None = None, origin: str | None = None
+    ) -> Iterator[EntityPayload]:
         """
         Query entity dicts via aggregate_unsafe(), bypassing FtM object construction.
 
         Args:
             q: Optional SQLAlchemy select (default: compile_query())
+            origin: Optional partition pruning, see :meth:`_query_statement_data`
 
         Yields:
             EntityPayload instances
         """
         if not self.exists:
             return
-        yield from aggregate_unsafe(self._query_statement_data(q), self.dataset)
+        rows = self._query_statement_data(q, origin=origin)
+        yield from aggregate_unsafe(rows, self.dataset)
 
     @no_api
     def query_changed(self, since: datetime) -> Iterator[EntityPayload]:
@@ -970,15 +1095,17 @@ class ParquetStore(LakehouseApiMixin):
     def _execute_sql(self, sql: str) -> Iterator[StatementDict]:
         """Stream raw-SQL results as ``StatementDict`` rows.
 
-        Counterpart to ``LakeStore._execute`` for SQL strings the
-        SQLAlchemy layer cannot express (the dedupe CTEs of
-        :func:`~ftm_lakehouse.logic.parquet.build_changed_sql`). The
+        Counterpart to ``LakeStore._execute`` for SQL strings – the dedupe
+        CTEs of :func:`~ftm_lakehouse.logic.parquet.build_changed_sql` the
+        SQLAlchemy layer cannot express, and literal-bound selects on the
+        partitioned statement read path (:meth:`_query_statement_data`). The
         cursor stays pinned in this generator's frame while its result
-        streams via ``fetchmany``.
+        streams as Arrow batches of :data:`SQL_BATCH_SIZE` rows; each batch
+        is converted to dicts column-wise by ``to_pylist`` instead of zipping
+        every row tuple in Python, and peak memory stays bounded per batch.
         """
         with self._lake.cursor() as cur:
-            res = cur.execute(sql)
-            cols = [d[0] for d in res.description]
-            while rows := res.fetchmany(100_000):
-                for row in rows:
-                    yield cast(StatementDict, dict(zip(cols, row)))
+            reader = cur.execute(sql).to_arrow_reader(SQL_BATCH_SIZE)
+            for batch in reader:
+                for row in batch.to_pylist():
+                    yield cast(StatementDict, row)
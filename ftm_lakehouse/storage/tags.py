@@ -46,6 +46,10 @@ class TagStore(AnyTags):
         """
         Check if the tag is more recent than all dependencies.
 
+        Dependencies are fetched lazily and the check returns as soon as one
+        of them is at least as recent as the tag, so a stale target doesn't
+        pay a store round-trip for every remaining dependency.
+
         Args:
             key: Tag key to check
             dependencies: Tag keys that this key depends on
@@ -56,11 +60,15 @@ class TagStore(AnyTags):
         last_updated = self.get(key)
         if last_updated is None:
             return False
-        updated_dependencies = [ensure_utc(i) for i in map(self.get, dependencies) if i]
-        if not updated_dependencies:
-            return False
         last_updated = ensure_utc(last_updated)
-        return all(last_updated > i for i in updated_dependencies)
+        found = False
+        for updated in map(self.get, dependencies):
+            if updated is None:
+                continue
+            if ensure_utc(updated) >= last_updated:
+                return False
+            found = True
+        return found
 
     def set(self, key: str, timestamp: datetime | None = None) -> datetime:
         """Set a tag to the given timestamp (or now, in UTC)."""
@@ -7,6 +7,9 @@ from anystore.logging import get_logger
 from anystore.model.base import BaseModel
 from anystore.store import get_store
 from anystore.types import M, Uri
+from anystore.util import join_uri
+from banal import ensure_dict
+from fsspec.core import url_to_fs
 
 from ftm_lakehouse.core.conventions import path
 from ftm_lakehouse.helpers.serialization import dump_model, load_model
@@ -16,13 +19,14 @@ from ftm_lakehouse.util import make_data_checksum
 log = get_logger(__name__)
 
 
-class VersionedModelStore(Generic[M]):
+class VersionStore:
     """
-    Timestamped snapshot storage for a given model type.
+    Timestamped snapshot storage for serialized pydantic models.
 
     Stores versioned copies of serialized pydantic models in a snapshot
     directory (versions/YYYY/MM/timestamp/filename) while also writing
-    to the main path.
+    to the main path. One underlying store and tag store is shared across
+    all model types, the model class is only needed to deserialize on `get`.
 
     Layout (relative):
     .../filename
@@ -30,15 +34,21 @@ class VersionedModelStore(Generic[M]):
         - Version: versions/YYYY/MM/{timestamp}/{filename}
     """
 
-    model: type[M]
-
-    def __init__(self, uri: Uri, model: type[M]) -> None:
+    def __init__(self, uri: Uri) -> None:
         self.uri = uri
         self._store = get_store(uri, serialization_mode="raw")
         self._tags = TagStore(uri)
-        self.model = model
 
-    def make(self, key: Uri, data: M) -> str:
+    def exists(self, key: str) -> bool:
+        return self._store.exists(key)
+
+    def delete(self, key: str) -> None:
+        self._store.delete(key)
+
+    def iterate_keys(self, **kwargs: Any) -> Generator[str, None, None]:
+        yield from self._store.iterate_keys(**kwargs)
+
+    def make(self, key: Uri, obj: BaseModel) -> str:
         """
         Write obj to key and create a versioned snapshot.
 
@@ -48,12 +58,12 @@ class VersionedModelStore(Generic[M]):
 
         Args:
             key: Main storage key
-            data: Pydantic model to store
+            obj: Pydantic model to store
 
         Returns:
             Path to the versioned copy (new or most recent existing)
         """
-        raw = dump_model(key, data)
+        raw = dump_model(key, obj)
         checksum = make_data_checksum(raw)
         checksum_tag = f"{key}-{checksum}"
         if self._tags.exists(checksum_tag):
@@ -62,60 +72,93 @@ class VersionedModelStore(Generic[M]):
         with self._tags.touch(key), self._tags.touch(checksum_tag):
             versioned_path = path.version(str(key))
             self._store.put(versioned_path, raw)
-            self._store.put(key, raw)
+            self._copy(versioned_path, str(key), raw)
             return versioned_path
 
-    def get(self, key: str) -> M:
-        """Get the current version of a file."""
-        return load_model(key, self._store.get(key), model=self.model)
-
-    def exists(self, key: str) -> bool:
-        return self._store.exists(key)
+    def _copy(self, src: str, dst: str, raw: bytes) -> None:
+        """Copy the just written snapshot to the main key.
 
-    def delete(self, key: str) -> None:
-        self._store.delete(key)
+        Remote object stores copy server-side via their fsspec filesystem, so
+        the payload is uploaded only once. Local stores write the bytes again
+        – a hardlink would share the inode with the snapshot, and the next
+        in-place write of the main key would alter the snapshot as well. So
+        do the http api (no copy primitive) and any store whose server-side
+        copy fails: the plain write is always correct, the copy only saves
+        an upload.
+        """
+        if not (self._store.is_local or self._store.is_http):
+            options = ensure_dict(self._store.backend_config)
+            try:
+                fs, src_path = url_to_fs(join_uri(self._store.uri, src), **options)
+                _, dst_path = url_to_fs(join_uri(self._store.uri, dst), **options)
+                fs.copy(src_path, dst_path)
+                return
+            except Exception as e:
+                log.debug(
+                    "Server-side copy failed, writing again",
+                    key=dst,
+                    error=str(e),
+                )
+        self._store.put(dst, raw)
+
+    def _load(self, key: str, model: type[M]) -> M:
+        return load_model(key, self._store.get(key), model=model)
 
-    def iterate_keys(self, **kwargs: Any) -> Generator[str, None, None]:
-        yield from self._store.iterate_keys(**kwargs)
+    def get(
+        self, key: str, model: type[M], raise_on_nonexist: bool | None = True
+    ) -> M | None:
+        """Get the current version of a file, deserialized into `model`."""
+        try:
+            return self._load(key, model)
+        except DoesNotExist as e:
+            if raise_on_nonexist:
+                raise e
 
     def list_versions(self, key: str) -> list[str]:
         """
         List all versioned copies of a file.
 
+        The listing is scoped to the exact `versions/YYYY/MM/{timestamp}/{key}`
+        layout via a glob, so snapshots of other files are filtered by the
+        store's listing instead of being yielded and string-matched here.
+
         Returns:
             List of version paths, sorted by timestamp
         """
-        versions = []
-        prefix = "versions"
-        for version_key in self._store.iterate_keys(prefix=prefix):
-            if version_key.endswith(key):
-                versions.append(version_key)
+        versions = self._store.iterate_keys(prefix=path.VERSIONS, glob=f"*/*/*/{key}")
         return sorted(versions)
 
 
-class VersionStore:
-    def __init__(self, uri: Uri) -> None:
+class VersionedModelStore(Generic[M]):
+    """
+    A :class:`VersionStore` bound to a given model type.
+    """
+
+    model: type[M]
+
+    def __init__(self, uri: Uri, model: type[M]) -> None:
         self.uri = uri
-        self._store = get_store(uri, serialization_mode="raw")
-        self.versions: dict[str, VersionedModelStore] = {}
+        self._versions = VersionStore(uri)
+        self.model = model
+
+    def make(self, key: Uri, data: M) -> str:
+        """Write data to key and create a versioned snapshot, see
+        :meth:`VersionStore.make`"""
+        return self._versions.make(key, data)
+
+    def get(self, key: str) -> M:
+        """Get the current version of a file."""
+        return self._versions._load(key, self.model)
 
     def exists(self, key: str) -> bool:
-        return self._store.exists(key)
+        return self._versions.exists(key)
 
-    def make(self, key: str, obj: BaseModel) -> str:
-        clz = obj.__class__.__name__
-        if clz not in self.versions:
-            self.versions[clz] = VersionedModelStore(self.uri, obj.__class__)
-        return self.versions[clz].make(key, obj)
+    def delete(self, key: str) -> None:
+        self._versions.delete(key)
 
-    def get(
-        self, key: str, model: type[M], raise_on_nonexist: bool | None = True
-    ) -> M | None:
-        clz = model.__name__
-        if clz not in self.versions:
-            self.versions[clz] = VersionedModelStore(self.uri, model)
-        try:
-            return self.versions[clz].get(key)
-        except DoesNotExist as e:
-            if raise_on_nonexist:
-                raise e
+    def iterate_keys(self, **kwargs: Any) -> Generator[str, None, None]:
+        yield from self._versions.iterate_keys(**kwargs)
+
+    def list_versions(self, key: str) -> list[str]:
+        """List all versioned copies of a file, sorted by timestamp."""
+        return self._versions.list_versions(key)
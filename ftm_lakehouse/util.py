@@ -164,6 +164,7 @@ def render(tmpl: str, data: dict[str, Any]) -> str:
     return template.render(**data)
 
 
+@lru_cache(1024)
 def validate_dataset_name(name: str) -> str:
     """Validate a dataset name against FollowTheMoney's naming rules and
     the lakehouse's reserved-name list.
@@ -171,6 +172,8 @@ def validate_dataset_name(name: str) -> str:
     The same check is used at every external entry point (API, CLI,
     :class:`Catalog`) so that a dataset name can be trusted as it flows
     into path construction, SQL identifiers, and DuckDB queries downstream.
+    As it runs on every repository lookup, valid names are cached (invalid
+    ones raise and are never cached).
 
     Args:
         name: The candidate dataset name.
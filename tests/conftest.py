@@ -1,24 +1,21 @@
+from __future__ import annotations
+
 import os
-import shutil
 import socket
 import subprocess
 import sys
 import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, NamedTuple
+from typing import TYPE_CHECKING, Generator, NamedTuple
 
-import boto3
 import pytest
-import requests
-import uvicorn
 from anystore.exceptions import DoesNotExist
 from anystore.store import get_store
-from boto3.resources.base import ServiceResource
 from fastapi import APIRouter, FastAPI
-from moto.server import ThreadedMotoServer
 
 from ftm_lakehouse.api.main import _not_found_handler
 from ftm_lakehouse.core.api import get_api
@@ -28,6 +25,9 @@ from ftm_lakehouse.repository import factories
 from ftm_lakehouse.repository.entities.main import EntityRepository
 from ftm_lakehouse.storage.journal import get_journal
 
+if TYPE_CHECKING:
+    from boto3.resources.base import ServiceResource
+
 FIXTURES_PATH = (Path(__file__).parent / "fixtures").absolute()
 
 # Test-mode switch:
@@ -130,6 +130,30 @@ def clear_factory_caches():
     set_model_class(DatasetModel)
 
 
+def remove_tree(root: Path) -> None:
+    """Remove a directory tree of many small files.
+
+    Walks with ``os.scandir`` (no per-entry ``stat`` round-trip), unlinks
+    files in parallel and removes the directories bottom-up afterwards.
+    """
+    files: list[str] = []
+    dirs: list[str] = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+    with ThreadPoolExecutor(16) as executor:
+        list(executor.map(os.unlink, files))
+    for current in reversed(dirs):
+        os.rmdir(current)
+
+
 @pytest.fixture(autouse=True, scope="session")
 def cleanup_fixtures_data():
     """Clean up any data created in fixtures directory during tests."""
@@ -143,7 +167,7 @@ def cleanup_fixtures_data():
         FIXTURES_PATH / "lake" / "new_dataset",
     ):
         if _dir.exists():
-            shutil.rmtree(_dir)
+            remove_tree(_dir)
 
 
 # https://pawamoy.github.io/posts/local-http-server-fake-files-testing-purposes/
@@ -152,23 +176,36 @@ def cleanup_fixtures_data():
 RANGE_HTTP_PORT = int(os.environ.get("LAKEHOUSE_TEST_RANGE_HTTP_PORT", "8765"))
 
 
+def wait_for_port(port: int, host: str = "127.0.0.1", timeout: float = 30) -> None:
+    """Block until ``host:port`` accepts tcp connections, probing with
+    exponential backoff (10ms up to 200ms)."""
+    delay = 0.01
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=delay):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Server at `{host}:{port}` not ready")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
+
+
 def spawn_and_wait_server():
     process = subprocess.Popen(
         [sys.executable, "-m", "RangeHTTPServer", str(RANGE_HTTP_PORT)],
         cwd=str(FIXTURES_PATH),
     )
-    while True:
-        try:
-            requests.get(f"http://localhost:{RANGE_HTTP_PORT}")
-        except Exception:
-            time.sleep(1)
-        else:
-            break
+    wait_for_port(RANGE_HTTP_PORT)
     return process
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def http_server():
+    """Serve ``tests/fixtures`` over http (range requests supported) for
+    tests crawling or reading a remote source. Opt-in: spawning the server
+    is a subprocess plus a port wait every session."""
     process = spawn_and_wait_server()
     yield process
     process.kill()
@@ -180,9 +217,14 @@ def http_server():
 @pytest.fixture(scope="session")
 def moto_server() -> Generator[ServiceResource, None, None]:
     """Fixture to run a mocked AWS server for testing with some data buckets."""
+    # heavy imports, only needed when an s3 test requests this fixture
+    import boto3
+    from moto.server import ThreadedMotoServer
+
     server = ThreadedMotoServer(port=8888)
     server.start()
     host, port = server.get_host_and_port()
+    wait_for_port(port, host)
     endpoint = f"http://{host}:{port}"
     yield boto3.resource("s3", region_name="us-east-1", endpoint_url=endpoint)
     server.stop()
@@ -191,6 +233,8 @@ def moto_server() -> Generator[ServiceResource, None, None]:
 @contextmanager
 def live_test_api_server(app):
     """Run FastAPI app on a real port for full HTTP integration testing."""
+    import uvicorn
+
     sock = socket.socket()
     sock.bind(("127.0.0.1", 0))
     port = sock.getsockname()[1]
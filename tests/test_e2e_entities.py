@@ -1,9 +1,8 @@
-import csv
 import itertools
 from typing import Generator
 
 import pytest
-from followthemoney import Statement, model
+from followthemoney import Statement
 from ftmq.model.stats import DatasetStats
 from ftmq.util import make_entity
 
@@ -14,6 +13,7 @@ from ftm_lakehouse.api.main import (
     operations_router,
 )
 from ftm_lakehouse.core.conventions import path
+from ftm_lakehouse.helpers.statements import stream_csv_rows
 from ftm_lakehouse.lake import get_lakehouse
 from ftm_lakehouse.logic.compress import CompressKind, decompress_stream
 from ftm_lakehouse.operation import ExportKind, export, optimize
@@ -62,7 +62,7 @@ def test_entities(dataset):
     entities = get_entities(dataset.name, dataset.uri)
 
     # Initially empty
-    assert len([e for e in entities.query()]) == 0
+    assert entities.count() == 0
 
     jane = make_entity(JANE)
     jane_fragment = make_entity(JANE_FIRSTNAME)
@@ -71,12 +71,12 @@ def test_entities(dataset):
     with entities.writer() as bulk:
         bulk.add_entity(jane)
 
-    assert len([e for e in entities.query(flush_first=True)]) == 1
+    assert entities.count(flush_first=True) == 1
 
     with entities.writer(origin="update") as bulk:
         bulk.add_entity(jane_fragment)
 
-    assert len([e for e in entities.query(flush_first=True)]) == 1
+    assert entities.count(flush_first=True) == 1
 
     # Get entity by ID
     jane = entities.get("jane")
@@ -105,15 +105,13 @@ def test_entities(dataset):
 
     with (
         entities._store.open(entities.EXPORTS_STATEMENTS) as fh,
-        decompress_stream(fh, entities.compression, "r") as out,
+        decompress_stream(fh, entities.compression) as out,
     ):
-        reader = csv.DictReader(out)
-        data = [r for r in reader]
+        data = list(stream_csv_rows(out, ["entity_id", "origin"]))
     assert len(data) == 6  # 2 jane (default) + 2 jane (update) + 2 john
-    stmts = [Statement.from_dict(d) for d in data]
-    entity_ids = set(s.entity_id for s in stmts)
+    entity_ids = set(d["entity_id"] for d in data)
     assert entity_ids == {"jane", "john"}
-    origins = set(s.origin for s in stmts)
+    origins = set(d["origin"] for d in data)
     assert origins == {"update", "default"}
 
     # Merge
@@ -160,27 +158,24 @@ def test_entity_multi_origin_fragments(dataset):
     """
     entities = get_entities(dataset.name, dataset.uri)
 
-    # Add same entity ID from three different origins with different properties
-    with entities.writer(origin="source_a") as bulk:
-        entity = model.make_entity("Person")
-        entity.id = "multi-origin-person"
-        entity.add("name", "John Smith")
-        entity.add("nationality", "us")
-        bulk.add_entity(entity)
-
-    with entities.writer(origin="source_b") as bulk:
-        entity = model.make_entity("Person")
-        entity.id = "multi-origin-person"
-        entity.add("birthDate", "1980-01-15")
-        entity.add("gender", "male")
-        bulk.add_entity(entity)
-
-    with entities.writer(origin="source_c") as bulk:
-        entity = model.make_entity("Person")
-        entity.id = "multi-origin-person"
-        entity.add("email", "john@example.com")
-        entity.add("nationality", "gb")  # Additional nationality
-        bulk.add_entity(entity)
+    # Add same entity ID from three different origins with different
+    # properties, all through a single writer (one journal transaction)
+    fragments = {
+        "source_a": {"name": ["John Smith"], "nationality": ["us"]},
+        "source_b": {"birthDate": ["1980-01-15"], "gender": ["male"]},
+        # Additional nationality
+        "source_c": {"email": ["john@example.com"], "nationality": ["gb"]},
+    }
+    with entities.writer() as bulk:
+        for origin, properties in fragments.items():
+            entity = make_entity(
+                {
+                    "id": "multi-origin-person",
+                    "schema": "Person",
+                    "properties": properties,
+                }
+            )
+            bulk.add_entity(entity, origin=origin)
 
     # Flush and export
     entities.flush()
@@ -271,18 +266,14 @@ def test_entity_multi_origin_statements(dataset):
         ),
     ]
 
-    # Add statements via bulk writer with different origins
-    with entities.writer(origin="registry") as bulk:
+    # Add statements via a single bulk writer with per-call origins
+    with entities.writer() as bulk:
         for stmt in stmts_source_a:
-            bulk.add_statement(stmt)
-
-    with entities.writer(origin="filings") as bulk:
+            bulk.add_statement(stmt, origin="registry")
         for stmt in stmts_source_b:
-            bulk.add_statement(stmt)
-
-    with entities.writer(origin="enrichment") as bulk:
+            bulk.add_statement(stmt, origin="filings")
         for stmt in stmts_source_c:
-            bulk.add_statement(stmt)
+            bulk.add_statement(stmt, origin="enrichment")
 
     # Flush and export
     entities.flush()
@@ -313,10 +304,9 @@ def test_entity_multi_origin_statements(dataset):
     # Verify statements.csv contains all origins
     with (
         entities._store.open(entities.EXPORTS_STATEMENTS) as fh,
-        decompress_stream(fh, entities.compression, "r") as out,
+        decompress_stream(fh, entities.compression) as out,
     ):
-        reader = csv.DictReader(out)
-        rows = [r for r in reader]
+        rows = list(stream_csv_rows(out, ["origin"]))
 
     stmt_origins = set(r["origin"] for r in rows)
     assert stmt_origins == {"registry", "filings", "enrichment"}
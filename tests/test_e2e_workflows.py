@@ -9,7 +9,6 @@ Tests the dependency tracking and skip logic for:
 - Versioning of generated files
 """
 
-import time
 from pathlib import Path
 from typing import Generator
 
@@ -63,13 +62,7 @@ def dataset(
 
 def count_versions(dataset: DatasetHandle, filename: str) -> int:
     """Count how many versioned copies of a file exist."""
-    return len(
-        [
-            v
-            for v in get_entities(*dataset)._store.iterate_keys(prefix="versions")
-            if v.endswith(filename)
-        ]
-    )
+    return len(get_versions(*dataset).list_versions(filename))
 
 
 # ---------------------------------------------------------------------------
@@ -114,16 +107,15 @@ def test_e2e_workflows_initial_crawl_and_make(dataset, fixtures_path):
 def test_e2e_workflows_make_skips_when_up_to_date(dataset, fixtures_path, request):
     """Test that make() skips processing when nothing has changed.
 
-    Note: The freshness checks use START timestamps intentionally.
-    This means the first make() after data changes will run twice:
-    1. First run: starts at T1, updates dependencies at T2 > T1
-    2. Second run: sees T1 < T2, runs again, no new dependency updates
-    3. Third run: properly skips because T2 (from run 2) > T2 (dependencies unchanged)
+    Note: The freshness checks use START timestamps intentionally. make()
+    flushes the journal before its own freshness check, so the flush's
+    statement update is older than the run's start and the next make()
+    already skips.
     """
     if "docker" in request.node.name:
         pytest.skip(
             "freshness ordering across nginx + UDS round-trips is too loose "
-            "for the 100ms timing window this test uses"
+            "for back-to-back make runs"
         )
     dataset, _ = dataset
 
@@ -131,19 +123,15 @@ def test_e2e_workflows_make_skips_when_up_to_date(dataset, fixtures_path, reques
     crawl(dataset.name, fixtures_path / "src", make_entities=True, uri=dataset.uri)
     make(*dataset)
 
-    # Second make - will run because dependencies were updated during first make
-    # (start timestamp < dependency update timestamp)
-    make(*dataset)
-
-    # Record versions after second make
+    # Record versions after first make
     initial_index_versions = count_versions(dataset, "index.json")
     initial_stats_versions = count_versions(dataset, "exports/statistics.json")
 
-    # Small delay to ensure timestamps differ
-    time.sleep(0.1)
-
-    # Third make - should skip because nothing changed since second make
-    make(*dataset)
+    # Second make, right away - should skip because nothing changed since
+    # the first make: its dependencies are strictly older than its tag, no
+    # matter the clock resolution
+    job = make(*dataset)
+    assert job.done == 0
 
     # No new versions should be created
     assert count_versions(dataset, "index.json") == initial_index_versions
@@ -213,9 +201,9 @@ def test_e2e_workflows_bulk_entity_writing(dataset):
     )
     assert stats.entity_count == 10
 
-    # Query entities back
-    entities = list(get_entities(*dataset).query(origin="bulk_test"))
-    assert len(entities) == 10
+    # Count entities back
+    assert get_entities(*dataset).count(origin="bulk_test") == 10
+    assert get_entities(*dataset).count(origin="other") == 0
 
 
 def test_e2e_workflows_multiple_origins(dataset):
@@ -273,8 +261,7 @@ def test_e2e_workflows_export_files_created(dataset):
     assert store.exists(path.EXPORTS_STATISTICS)
 
     # Record initial file size
-    initial_csv_content = store.get(path.EXPORTS_STATEMENTS)
-    initial_csv_size = len(initial_csv_content)
+    initial_csv_size = store.info(path.EXPORTS_STATEMENTS).size
 
     # Add more data and re-export
     with get_entities(*dataset).writer(origin="test") as writer:
@@ -287,8 +274,7 @@ def test_e2e_workflows_export_files_created(dataset):
     export(dataset.name, ExportKind.statements, dataset.uri)
 
     # Verify the file is bigger (more statements)
-    new_csv_content = store.get(path.EXPORTS_STATEMENTS)
-    new_csv_size = len(new_csv_content)
+    new_csv_size = store.info(path.EXPORTS_STATEMENTS).size
     assert new_csv_size > initial_csv_size
 
 
@@ -373,7 +359,7 @@ def test_e2e_workflows_iterate_vs_query_entities(dataset):
             writer.add_entity(entity)
 
     assert len(list(get_entities(*dataset).stream())) == 0
-    assert len(list(get_entities(*dataset).query(flush_first=True))) == 3
+    assert get_entities(*dataset).count(flush_first=True) == 3
 
     # After full make, stream() also works
     make(*dataset)
@@ -0,0 +1,24 @@
+from anystore.store.resource import UriResource
+
+from ftm_lakehouse.helpers.dataset import make_resource
+
+
+def test_helpers_dataset_make_resource_reuses_checksum(tmp_path, monkeypatch):
+    uri = tmp_path / "statements.csv"
+    uri.write_text("id,entity_id\n")
+    resource = make_resource(str(uri))
+    assert resource.checksum
+    assert resource.size == uri.stat().st_size
+
+    def _checksum(*args, **kwargs):
+        raise AssertionError("checksum should be reused")
+
+    with monkeypatch.context() as m:
+        m.setattr(UriResource, "checksum", _checksum)
+        reused = make_resource(str(uri), previous=resource)
+    assert reused.checksum == resource.checksum
+
+    # a rewritten file is hashed again
+    uri.write_text("id,entity_id,prop\n")
+    changed = make_resource(str(uri), previous=resource)
+    assert changed.checksum != resource.checksum
@@ -1,3 +1,5 @@
+from followthemoney import model
+from rigour.mime import normalize_mimetype
 from rigour.mime.types import DEFAULT, HTML, PDF, WORD
 
 from ftm_lakehouse.helpers import file
@@ -10,3 +12,20 @@ def test_helpers_file():
     assert file.mime_to_schema(WORD).name == "Pages"
     assert file.mime_to_schema(DEFAULT).name == "Document"
     assert file.mime_to_schema("foo").name == "Document"
+
+
+def test_helpers_file_mime_schemas():
+    """The inverted lookup maps like the first-match scan over MIME_SCHEMAS."""
+
+    def scan(mimetype: str):
+        for mtypes, schema in file.MIME_SCHEMAS.items():
+            if mimetype in mtypes and schema is not None:
+                return schema
+        return model["Document"]
+
+    for mtypes in file.MIME_SCHEMAS:
+        for mimetype in mtypes:
+            if mimetype:
+                assert file.mime_to_schema(mimetype) == scan(
+                    normalize_mimetype(mimetype)
+                )
@@ -1,6 +1,13 @@
+import csv
+from io import BytesIO, StringIO
+
 from followthemoney import Statement
 
-from ftm_lakehouse.helpers.statements import pack_statement, unpack_statement
+from ftm_lakehouse.helpers.statements import (
+    pack_statement,
+    stream_csv_rows,
+    unpack_statement,
+)
 
 
 def test_helpers_statement():
@@ -48,3 +55,25 @@ def test_helpers_statement():
     # Timestamps default to current time
     assert unpacked.first_seen is not None
     assert unpacked.last_seen is not None
+
+
+def test_helpers_statement_stream_csv_rows():
+    """Arrow-parsed rows match what csv.DictReader yields."""
+    data = (
+        "id,entity_id,prop,value,lang,first_seen\n"
+        's1,jane,name,"Jane\nDoe",,2024-01-01T00:00:00+00:00\n'
+        "s2,jane,birthDate,1970,en,\n"
+    )
+    rows = list(stream_csv_rows(BytesIO(data.encode())))
+    assert rows == list(csv.DictReader(StringIO(data)))
+    assert rows[0]["value"] == "Jane\nDoe"
+    assert rows[0]["lang"] == ""
+    assert rows[1]["value"] == "1970"
+
+    rows = list(stream_csv_rows(BytesIO(data.encode()), ["entity_id", "value"]))
+    assert rows == [
+        {"entity_id": "jane", "value": "Jane\nDoe"},
+        {"entity_id": "jane", "value": "1970"},
+    ]
+
+    assert list(stream_csv_rows(BytesIO(b""))) == []
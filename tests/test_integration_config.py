@@ -11,9 +11,10 @@ from ftm_lakehouse.catalog import (
     get_dataset_model,
     update_dataset,
 )
+from ftm_lakehouse.core.config import load_yaml
 from ftm_lakehouse.core.conventions import path
 from ftm_lakehouse.model import DatasetModel
-from ftm_lakehouse.repository.factories import get_entities
+from ftm_lakehouse.repository.factories import get_entities, get_versions
 
 
 def test_config_initialization(fixtures_path, tmp_path):
@@ -32,14 +33,18 @@ def test_config_initialization(fixtures_path, tmp_path):
     assert get_dataset_model("test_dataset", uri).name == "test_dataset"
 
 
+def _config_versions(name, uri=None) -> int:
+    # scoped glob listing, no walk over every versioned file
+    return len(get_versions(name, uri).list_versions(path.CONFIG))
+
+
 def test_config_edit(tmp_path):
     catalog = get_lakehouse(tmp_path)
     uri = catalog.dataset_uri("test_dataset")
     update_dataset("test_dataset", uri, title="A nice title")
     assert get_dataset_model("test_dataset", uri).title == "A nice title"
-    store = get_entities("test_dataset", uri)._store
-    assert len([k for k in store.iterate_keys(prefix="versions")]) == 1
-    data = yaml.safe_load(smart_read(tmp_path / "test_dataset/config.yml"))
+    assert _config_versions("test_dataset", uri) == 1
+    data = load_yaml(smart_read(tmp_path / "test_dataset/config.yml"))
     assert data["title"] == "A nice title"
     assert "description" not in data
 
@@ -47,18 +52,27 @@ def test_config_edit(tmp_path):
     model = get_dataset_model("test_dataset", uri)
     assert model.title == "A nice title"
     assert model.description == "The description"
-    store = get_entities("test_dataset", uri)._store
-    assert len([k for k in store.iterate_keys(prefix="versions")]) == 2
-    data = yaml.safe_load(smart_read(tmp_path / "test_dataset/config.yml"))
+    assert _config_versions("test_dataset", uri) == 2
+    data = load_yaml(smart_read(tmp_path / "test_dataset/config.yml"))
     assert data["title"] == "A nice title"
     assert data["description"] == "The description"
 
 
-def _config_versions(name, uri=None) -> int:
-    store = get_entities(name, uri)._store
-    return len(
-        [v for v in store.iterate_keys(prefix="versions") if v.endswith("config.yml")]
-    )
+def test_config_reads_follow_writes(tmp_path):
+    """Config reads always reflect the current file."""
+    uri = get_lakehouse(tmp_path).dataset_uri("test_dataset")
+    update_dataset("test_dataset", uri, title="AAAA")
+    assert get_dataset_model("test_dataset", uri).title == "AAAA"
+    # back to back, same size
+    update_dataset("test_dataset", uri, title="BBBB")
+    assert get_dataset_model("test_dataset", uri).title == "BBBB"
+
+    # edited by hand
+    config = tmp_path / "test_dataset/config.yml"
+    data = load_yaml(smart_read(config))
+    data["title"] = "Edited by hand"
+    config.write_text(yaml.safe_dump(data))
+    assert get_dataset_model("test_dataset", uri).title == "Edited by hand"
 
 
 def test_dataset_metadata(monkeypatch, tmp_path):
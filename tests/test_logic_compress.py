@@ -105,6 +105,22 @@ def test_gzip_output_is_deterministic():
     assert run() == run()
 
 
+def test_zstd_output_is_deterministic():
+    """Worker-threaded zstd still yields identical bytes per payload."""
+    payload = b"id,value\n" + b"".join(b"%d,row\n" % i for i in range(100_000))
+
+    def run() -> bytes:
+        raw = io.BytesIO()
+        with compress_stream(raw, CompressKind.zst) as out:
+            out.write(payload)
+        return raw.getvalue()
+
+    data = run()
+    assert data == run()
+    with decompress_stream(io.BytesIO(data), CompressKind.zst) as fh:
+        assert fh.read() == payload
+
+
 def test_no_algorithm_passes_the_handle_through():
     """``None`` hands back the handle itself, and it must stay a real file
     object: consumers type-check what they get – anystore's writer treats a
@@ -8,6 +8,19 @@ from ftm_lakehouse.model.file import File
 FAKE_CHECKSUM = "5b93539659eb03f4c5dfa64f342a667db6946913ce4d3243f4846bbe37f391d9"
 
 
+def _construct_file(key: str) -> File:
+    """An unvalidated File, for checks that only need ``key`` / ``dataset``
+    (no generated ``id``, so not usable for :meth:`File.to_entity`)."""
+    return File.model_construct(
+        dataset="test",
+        checksum=FAKE_CHECKSUM,
+        key=key,
+        name="test.txt",
+        store="s3://bucket",
+        size=100,
+    )
+
+
 def test_model_file(fixtures_path):
     checksum = FAKE_CHECKSUM
     file_id = "file-df082aa01243e36fed47a2b1de2bd563ad6dae11449431d9a1ef3795c63e0427"
@@ -29,6 +42,8 @@ def test_model_file(fixtures_path):
     assert file_dict["id"] == file_id
     assert file_dict["size"] == 19
     assert file_dict["key"] == "src/utf.txt"
+    assert file_dict["name"] == "utf.txt"
+    assert file_dict["mimetype"] == PLAIN
     assert file_dict["dataset"] == "default"
     assert file_dict["checksum"] == checksum
 
@@ -146,14 +161,7 @@ def test_model_file_parents():
     assert entity.first("parent") == folders[1].id
 
     # no parents
-    file = File(
-        dataset="test",
-        checksum=FAKE_CHECKSUM,
-        key="test.txt",
-        name="test.txt",
-        store="s3://bucket",
-        size=100,
-    )
+    file = _construct_file(key="test.txt")
     assert len(list(file.make_parents())) == 0
 
     # test weird (trailing WS) but valid folder path
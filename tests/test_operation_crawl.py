@@ -1,4 +1,7 @@
-from ftmq.query import M, Query
+import shutil
+from collections import Counter
+
+import pytest
 
 from ftm_lakehouse.core.conventions import tag
 from ftm_lakehouse.operation.crawl import CrawlJob, CrawlOperation
@@ -17,7 +20,6 @@ def test_operation_crawl(fixtures_path, tmp_path):
 
     # Verify target and dependencies
     assert op.get_target() == tag.OP_CRAWL
-    assert op.get_target() == "operations/crawl/last_run"
     assert op.get_dependencies() == []
 
     res = op.run()
@@ -27,8 +29,14 @@ def test_operation_crawl(fixtures_path, tmp_path):
     assert (tmp_path / "tags/lakehouse/operations/crawl/last_run").exists()
 
     # Verify archived files
-    files = [f for f in op.archive.iterate_files()]
-    assert len(files) == 5
+    keys = {f.key for f in op.archive.iterate_files()}
+    assert keys == {
+        "companies.csv",
+        "donations.ijson",
+        "example.pdf",
+        "testdir/test.txt",
+        "utf.txt",
+    }
 
     file = op.archive.get_file(
         "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
@@ -38,18 +46,17 @@ def test_operation_crawl(fixtures_path, tmp_path):
 
     # Verify auto-flush happened (journal should be empty, store should have data)
     assert op.entities._journal.count() == 0
-    assert op.entities._statements.stats().entity_count > 0
 
     # Verify entities (no flush needed, CrawlOperation auto-flushes)
-    entities = list(op.entities.query(origin=tag.CRAWL_ORIGIN))
-    assert len(entities) == 5 + 1  # files + folder
-
-    assert len(list(op.entities.query(Query().where(M(schema="Pages"))))) == 1
-    assert len(list(op.entities.query(Query().where(M(schema="Folder"))))) == 1
+    entities = op.entities.query(origin=tag.CRAWL_ORIGIN)
+    schemata = Counter(e.schema.name for e in entities)
+    assert schemata.total() == 5 + 1  # files + folder
+    assert schemata["Pages"] == 1
+    assert schemata["Folder"] == 1
 
 
 def test_operation_crawl_globs(fixtures_path, tmp_path):
-    """Test CrawlOperation with glob filters."""
+    """Test CrawlOperation with glob filters, crawling into the same lake."""
     job = CrawlJob.make(
         dataset=DATASET,
         uri=fixtures_path / "src",
@@ -59,8 +66,7 @@ def test_operation_crawl_globs(fixtures_path, tmp_path):
     op = CrawlOperation(job=job, uri=tmp_path)
     res = op.run()
     assert res.done == 4
-    entities = list(op.entities.query(origin=tag.CRAWL_ORIGIN))
-    assert len(entities) == 4 + 1  # files + folder
+    assert op.entities.count(origin=tag.CRAWL_ORIGIN) == 4 + 1  # files + folder
 
     job = CrawlJob.make(
         dataset=DATASET, uri=fixtures_path / "src", glob="*.pdf", make_entities=True
@@ -68,5 +74,79 @@ def test_operation_crawl_globs(fixtures_path, tmp_path):
     op = CrawlOperation(job=job, uri=tmp_path)
     res = op.run()
     assert res.done == 1
-    entities = list(op.entities.query(origin=tag.CRAWL_ORIGIN))
-    assert len(entities) == 5 + 1  # files + folder
+    assert op.entities.count(origin=tag.CRAWL_ORIGIN) == 5 + 1  # files + folder
+
+
+def test_operation_crawl_failure_keeps_batch_entities(
+    fixtures_path, tmp_path, monkeypatch
+):
+    """A file failing mid-batch doesn't discard the entities of the files
+    archived before it in the batch – a skip-path re-run skips those."""
+    job = CrawlJob.make(dataset=DATASET, uri=fixtures_path / "src", make_entities=True)
+    op = CrawlOperation(job=job, uri=tmp_path)
+    handle_crawl = op.handle_crawl
+    crawled: list[str] = []
+
+    def _handle_crawl(uri, *args, **kwargs):
+        if len(crawled) == 3:
+            raise OSError(f"Can't read `{uri}`")
+        crawled.append(uri)
+        return handle_crawl(uri, *args, **kwargs)
+
+    monkeypatch.setattr(op, "handle_crawl", _handle_crawl)
+    with pytest.raises(OSError):
+        op.run()
+
+    # the re-run skips the archived files and crawls the rest
+    job = CrawlJob.make(dataset=DATASET, uri=fixtures_path / "src", make_entities=True)
+    op = CrawlOperation(job=job, uri=tmp_path)
+    res = op.run()
+    assert res.done == 5 - 3
+
+    files = {f.key: f for f in op.archive.iterate_files()}
+    for uri in crawled:
+        assert op.entities.get(files[uri].id) is not None
+    assert op.entities.count(origin=tag.CRAWL_ORIGIN) == 5 + 1  # files + folder
+
+
+def test_operation_crawl_checksum_cache(fixtures_path, tmp_path, monkeypatch):
+    """Unchanged source files reuse the cached checksum on re-crawl."""
+    src = tmp_path / "src"
+    shutil.copytree(fixtures_path / "src", src)
+    lake = tmp_path / "lake"
+
+    job = CrawlJob.make(dataset=DATASET, uri=src)
+    res = CrawlOperation(job=job, uri=lake).run()
+    assert res.done == 5
+
+    op = CrawlOperation(job=CrawlJob.make(dataset=DATASET, uri=src), uri=lake)
+    hashed = []
+    checksum = op.source.checksum
+
+    def _checksum(key, *args, **kwargs):
+        hashed.append(key)
+        return checksum(key, *args, **kwargs)
+
+    monkeypatch.setattr(op.source, "checksum", _checksum)
+    res = op.run()
+    assert res.done == 0
+    assert hashed == []
+
+    # an unchanged source tree is skipped as a whole
+    op = CrawlOperation(job=CrawlJob.make(dataset=DATASET, uri=src), uri=lake)
+
+    def _handle_crawl(*args, **kwargs):
+        raise AssertionError("unchanged files must not be looked at")
+
+    monkeypatch.setattr(op, "handle_crawl", _handle_crawl)
+    res = op.run()
+    assert res.done == 0
+    assert res.pending == 0
+
+    # a changed file is hashed (and archived) again
+    (src / "testdir/test.txt").write_text("changed content")
+    op = CrawlOperation(job=CrawlJob.make(dataset=DATASET, uri=src), uri=lake)
+    monkeypatch.setattr(op.source, "checksum", _checksum)
+    res = op.run()
+    assert res.done == 1
+    assert hashed == ["testdir/test.txt"]
@@ -18,9 +18,9 @@ def test_operation_download_archive(tmp_path, fixtures_path):
     repo = EntityRepository(dataset=DATASET, uri=dataset_path)
 
     # Archive files and write their entities
-    for key in ["utf.txt", "companies.csv"]:
-        doc = archive.store(fixtures_path / "src" / key)
-        with repo.writer() as writer:
+    with repo.writer() as writer:
+        for key in ("utf.txt", "companies.csv"):
+            doc = archive.store(fixtures_path / "src" / key)
             for entity in doc.make_entities():
                 writer.add_entity(entity)
     repo.flush()
@@ -49,10 +49,7 @@ def test_operation_download_archive(tmp_path, fixtures_path):
     assert result.stopped is not None
 
     # Verify files were downloaded to target with their original names
-    downloaded = list(target_path.rglob("*"))
-    downloaded_files = [p for p in downloaded if p.is_file()]
-    assert len(downloaded_files) == 2
-
-    names = {p.name for p in downloaded_files}
+    names = [p.name for p in target_path.rglob("*") if p.is_file()]
+    assert len(names) == 2
     assert "utf.txt" in names
     assert "companies.csv" in names
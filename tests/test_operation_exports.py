@@ -1,12 +1,20 @@
 """Tests for the ExportOperation kinds - statements, entities, statistics, documents, index."""
 
+import hashlib
+import shutil
+from pathlib import Path
+
+import pytest
 from anystore.io import smart_stream_csv_models
+from anystore.store.resource import UriResource
 from ftmq.util import make_entity
 
 from ftm_lakehouse.core.conventions import path, tag
+from ftm_lakehouse.core.settings import CHECKSUM_ALGORITHM
 from ftm_lakehouse.model.dataset import DatasetModel
 from ftm_lakehouse.model.file import Document
 from ftm_lakehouse.operation.export import ExportJob, ExportKind, ExportOperation
+from ftm_lakehouse.operation.make import MAKE_EXPORTS, MakeJob, MakeOperation
 from ftm_lakehouse.repository import ArchiveRepository, EntityRepository
 from tests.shared import BOB, JANE, JOHN
 
@@ -21,15 +29,57 @@ def setup_entities(repo: EntityRepository) -> None:
     repo.flush()
 
 
+@pytest.fixture(scope="module")
+def prepared_lake(tmp_path_factory) -> Path:
+    """A flushed dataset with the test entities, built once per module.
+
+    Tests that only read the statement store copy it via :func:`copy_lake`
+    instead of running a writer + flush each.
+    """
+    lake = tmp_path_factory.mktemp("export_lake") / DATASET
+    setup_entities(EntityRepository(dataset=DATASET, uri=lake))
+    return lake
+
+
+@pytest.fixture(scope="module")
+def prepared_index_lake(tmp_path_factory, prepared_lake) -> Path:
+    """The prepared dataset with the index prerequisites (statistics and
+    entities exports) already run, built once per module."""
+    lake = copy_lake(prepared_lake, tmp_path_factory.mktemp("export_index_lake"))
+    make_op(ExportKind.statistics, lake).run()
+    make_op(ExportKind.entities, lake).run()
+    return lake
+
+
+@pytest.fixture(scope="module")
+def prepared_documents_lake(tmp_path_factory, fixtures_path) -> Path:
+    """A flushed dataset with archived files and their entities, built once
+    per module."""
+    lake = tmp_path_factory.mktemp("export_documents_lake") / DATASET
+    archive = ArchiveRepository(dataset=DATASET, uri=lake)
+    repo = EntityRepository(dataset=DATASET, uri=lake)
+    with repo.writer() as writer:
+        for key in ("utf.txt", "companies.csv"):
+            doc = archive.store(fixtures_path / "src" / key)
+            for entity in doc.make_entities():
+                writer.add_entity(entity)
+    repo.flush()
+    return lake
+
+
+def copy_lake(lake: Path, tmp_path: Path) -> Path:
+    """Copy a prepared dataset into the test's own ``tmp_path``."""
+    return Path(shutil.copytree(lake, tmp_path / DATASET))
+
+
 def make_op(kind: ExportKind, tmp_path, **kwargs) -> ExportOperation:
     job = ExportJob.make(dataset=DATASET, kind=kind, **kwargs)
     return ExportOperation(job=job, uri=tmp_path)
 
 
-def test_operation_export_statements(tmp_path):
+def test_operation_export_statements(tmp_path, prepared_lake):
     """Export kind=statements: parquet to statements.csv with tags."""
-    repo = EntityRepository(dataset=DATASET, uri=tmp_path)
-    setup_entities(repo)
+    tmp_path = copy_lake(prepared_lake, tmp_path)
 
     # No target tag before run
     target_path = "tags/lakehouse/exports/statements.csv"
@@ -39,9 +89,7 @@ def test_operation_export_statements(tmp_path):
     op = make_op(ExportKind.statements, tmp_path)
 
     assert op.get_target() == path.EXPORTS_STATEMENTS
-    assert op.get_target() == "exports/statements.csv"
     assert op.get_dependencies() == [tag.STATEMENTS_UPDATED, tag.JOURNAL_UPDATED]
-    assert op.get_dependencies() == ["statements/last_updated", "journal/last_updated"]
 
     # Run the export operation
     result = op.run()
@@ -57,11 +105,9 @@ def test_operation_export_statements(tmp_path):
     assert (tmp_path / "exports/statements.csv").exists()
 
 
-def test_operation_export_entities(tmp_path):
+def test_operation_export_entities(tmp_path, prepared_lake):
     """Export kind=entities: parquet to entities.ftm.json with tags."""
-    tmp_path = tmp_path / DATASET
-    repo = EntityRepository(dataset=DATASET, uri=tmp_path)
-    setup_entities(repo)
+    tmp_path = copy_lake(prepared_lake, tmp_path)
 
     # No target tag before run
     target_path = "tags/lakehouse/entities.ftm.json"
@@ -71,7 +117,6 @@ def test_operation_export_entities(tmp_path):
     op = make_op(ExportKind.entities, tmp_path)
 
     assert op.get_target() == path.ENTITIES_JSON
-    assert op.get_target() == "entities.ftm.json"
     assert op.get_dependencies() == [tag.STATEMENTS_UPDATED, tag.JOURNAL_UPDATED]
 
     # Run the export operation
@@ -88,11 +133,9 @@ def test_operation_export_entities(tmp_path):
     assert (tmp_path / "entities.ftm.json").exists()
 
 
-def test_operation_export_statistics(tmp_path):
+def test_operation_export_statistics(tmp_path, prepared_lake):
     """Export kind=statistics: parquet to statistics.json with tags."""
-    tmp_path = tmp_path / DATASET
-    repo = EntityRepository(dataset=DATASET, uri=tmp_path)
-    setup_entities(repo)
+    tmp_path = copy_lake(prepared_lake, tmp_path)
 
     # No target tag before run
     target_path = "tags/lakehouse/exports/statistics.json"
@@ -102,7 +145,6 @@ def test_operation_export_statistics(tmp_path):
     op = make_op(ExportKind.statistics, tmp_path)
 
     assert op.get_target() == path.EXPORTS_STATISTICS
-    assert op.get_target() == "exports/statistics.json"
     assert op.get_dependencies() == [tag.STATEMENTS_UPDATED, tag.JOURNAL_UPDATED]
 
     # Run the export operation
@@ -116,19 +158,15 @@ def test_operation_export_statistics(tmp_path):
     assert (tmp_path / target_path).exists()
 
     # Verify output file exists (versioned, so check versions dir)
-    versions = list((tmp_path / "versions").rglob("exports/statistics.json"))
-    assert len(versions) >= 1
+    assert (
+        next((tmp_path / "versions").rglob("exports/statistics.json"), None) is not None
+    )
 
 
-def test_operation_export_index(tmp_path):
+def test_operation_export_index(tmp_path, prepared_index_lake):
     """Export kind=index: generate index.json with tags."""
-    tmp_path = tmp_path / DATASET
-    repo = EntityRepository(dataset=DATASET, uri=tmp_path)
-    setup_entities(repo)
-
-    # Run prerequisites first (statistics and entities exports)
-    make_op(ExportKind.statistics, tmp_path).run()
-    make_op(ExportKind.entities, tmp_path).run()
+    # statistics and entities exports already ran in the fixture
+    tmp_path = copy_lake(prepared_index_lake, tmp_path)
 
     # No target tag before run
     target_path = "tags/lakehouse/index.json"
@@ -138,19 +176,12 @@ def test_operation_export_index(tmp_path):
     op = make_op(ExportKind.index, tmp_path)
 
     assert op.get_target() == path.INDEX
-    assert op.get_target() == "index.json"
     assert op.get_dependencies() == [
         path.CONFIG,
         path.EXPORTS_STATISTICS,
         path.ENTITIES_JSON,
         path.EXPORTS_DOCUMENTS,
     ]
-    assert op.get_dependencies() == [
-        "config.yml",
-        "exports/statistics.json",
-        "entities.ftm.json",
-        "exports/documents.csv",
-    ]
 
     # Run the export operation (requires dataset model)
     dataset = DatasetModel(name=DATASET, title="Export Test Dataset")
@@ -164,19 +195,59 @@ def test_operation_export_index(tmp_path):
     assert (tmp_path / target_path).exists()
 
     # Verify output file exists (versioned, so check versions dir)
-    versions = list((tmp_path / "versions").rglob("index.json"))
-    assert len(versions) >= 1
+    assert next((tmp_path / "versions").rglob("index.json"), None) is not None
 
 
-def test_export_entities_reuses_fresh_statements_csv(tmp_path):
+def test_operation_export_index_rehashes_rewritten_exports(
+    tmp_path, prepared_index_lake, monkeypatch
+):
+    """Index resources reuse the published checksum only for artifacts not
+    exported again since the index was built – a same-size rewrite is
+    hashed again."""
+    tmp_path = copy_lake(prepared_index_lake, tmp_path)
+    make_op(ExportKind.statements, tmp_path).run()
+    make_op(ExportKind.index, tmp_path).run()
+
+    def published() -> dict[str, str]:
+        op = make_op(ExportKind.index, tmp_path)
+        index = op._versions.get(path.INDEX, DatasetModel)
+        return {r.name: r.checksum for r in index.resources}
+
+    before = published()
+    assert "statements.csv" in before
+
+    # nothing exported since: every checksum is reused, no file is hashed
+    def _checksum(*args, **kwargs):
+        raise AssertionError("checksum should be reused")
+
+    with monkeypatch.context() as m:
+        m.setattr(UriResource, "checksum", _checksum)
+        make_op(ExportKind.index, tmp_path).run(force=True)
+    assert published() == before
+
+    # a re-export with different content of the same size
+    csv = tmp_path / path.EXPORTS_STATEMENTS
+    rewritten = csv.read_bytes()[::-1]
+    csv.write_bytes(rewritten)
+    EntityRepository(dataset=DATASET, uri=tmp_path)._tags.set(path.EXPORTS_STATEMENTS)
+    make_op(ExportKind.index, tmp_path).run(force=True)
+    after = published()
+    assert after["statements.csv"] != before["statements.csv"]
+    assert (
+        after["statements.csv"]
+        == hashlib.new(CHECKSUM_ALGORITHM, rewritten).hexdigest()
+    )
+
+
+def test_export_entities_reuses_fresh_statements_csv(tmp_path, prepared_lake):
     """The entities export reuses statements.csv while it's fresh.
 
     Regression: the freshness check used the dead ``exports/statements``
     tag instead of the export's actual target key, so the reuse path
     never fired.
     """
+    tmp_path = copy_lake(prepared_lake, tmp_path)
     repo = EntityRepository(dataset=DATASET, uri=tmp_path)
-    setup_entities(repo)
 
     assert repo._fresh_statements_csv() is None  # nothing exported yet
 
@@ -192,12 +263,12 @@ def test_export_entities_reuses_fresh_statements_csv(tmp_path):
     assert repo._fresh_statements_csv() is None
 
 
-def test_export_stale_after_optimize(tmp_path):
+def test_export_stale_after_optimize(tmp_path, prepared_lake):
     """A merge that rewrote partitions stamps STATEMENTS_UPDATED, so exports
     captured pre-merge go stale and re-run instead of skipping as
     'up-to-date' with duplicate / undeleted rows baked in."""
+    tmp_path = copy_lake(prepared_lake, tmp_path)
     repo = EntityRepository(dataset=DATASET, uri=tmp_path)
-    setup_entities(repo)
     setup_entities(repo)  # duplicate physical rows -> merge will rewrite
 
     make_op(ExportKind.statements, tmp_path).run()
@@ -218,19 +289,9 @@ def test_export_stale_after_optimize(tmp_path):
     assert repo._fresh_statements_csv() is not None
 
 
-def test_operation_export_documents(tmp_path, fixtures_path):
+def test_operation_export_documents(tmp_path, prepared_documents_lake):
     """Export kind=documents: parquet to documents.csv with tags."""
-    tmp_path = tmp_path / DATASET
-    archive = ArchiveRepository(dataset=DATASET, uri=tmp_path)
-    repo = EntityRepository(dataset=DATASET, uri=tmp_path)
-
-    # Archive files and write their entities
-    for key in ["utf.txt", "companies.csv"]:
-        doc = archive.store(fixtures_path / "src" / key)
-        with repo.writer() as writer:
-            for entity in doc.make_entities():
-                writer.add_entity(entity)
-    repo.flush()
+    tmp_path = copy_lake(prepared_documents_lake, tmp_path)
 
     # No target tag before run
     target_path = "tags/lakehouse/exports/documents.csv"
@@ -240,7 +301,6 @@ def test_operation_export_documents(tmp_path, fixtures_path):
     op = make_op(ExportKind.documents, tmp_path)
 
     assert op.get_target() == path.EXPORTS_DOCUMENTS
-    assert op.get_target() == "exports/documents.csv"
     assert op.get_dependencies() == [tag.STATEMENTS_UPDATED, tag.JOURNAL_UPDATED]
 
     # Run the export operation
@@ -261,3 +321,36 @@ def test_operation_export_documents(tmp_path, fixtures_path):
     assert len(docs) == 2
     for doc in docs:
         assert doc.public_url.startswith(f"https://data.example.org/{DATASET}/archive/")
+
+
+def test_operation_make_covers_all_exports():
+    """A full make runs every export kind once, index last."""
+    assert sorted(MAKE_EXPORTS) == sorted(ExportKind)
+    assert MAKE_EXPORTS[-1] == ExportKind.index
+
+
+def test_operation_make_order():
+    """``entities`` reads the ``statements.csv`` written before it."""
+    assert MAKE_EXPORTS.index(ExportKind.statements) < MAKE_EXPORTS.index(
+        ExportKind.entities
+    )
+
+
+def test_operation_make_dirty_journal(tmp_path):
+    """Make flushes pending journal rows once, then runs every export."""
+    tmp_path = tmp_path / DATASET
+    repo = EntityRepository(dataset=DATASET, uri=tmp_path)
+    with repo.writer(origin="test") as writer:
+        writer.add_entity(make_entity(JANE))
+        writer.add_entity(make_entity(JOHN))
+    assert repo._journal.count() > 0  # not flushed yet
+
+    job = MakeJob.make(dataset=DATASET)
+    result = MakeOperation(job=job, uri=tmp_path).run()
+    assert result.done == 1
+
+    assert repo._journal.count() == 0
+    assert repo.count() == 2
+    assert (tmp_path / repo.EXPORTS_STATEMENTS).exists()
+    assert len(list(repo.stream())) == 2
+    assert (tmp_path / "tags/lakehouse" / path.INDEX).exists()
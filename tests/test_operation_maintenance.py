@@ -24,9 +24,10 @@ def count_parquet_on_disk(tmp_path) -> int:
 
 
 def _add_batches(repo: EntityRepository, n: int = 3) -> None:
-    """Create ``n`` parquet files by flushing ``n`` separate origin batches."""
-    for i in range(n):
-        with repo.writer(origin=f"batch_{i}") as writer:
+    """Create ``n`` parquet files with a single flush: each entity gets its
+    own origin, and origins are separate partitions of the store."""
+    with repo.writer() as writer:
+        for i in range(n):
             entity = make_entity(
                 {
                     "id": f"entity-{i}",
@@ -34,14 +35,14 @@ def _add_batches(repo: EntityRepository, n: int = 3) -> None:
                     "properties": {"name": [f"Person {i}"]},
                 }
             )
-            writer.add_entity(entity)
-        repo.flush()
+            writer.add_entity(entity, origin=f"batch_{i}")
+    repo.flush()
 
 
 def test_operation_optimize(tmp_path):
     """OptimizeOperation runs merge, compact and vacuum in one pass.
 
-    Three separate origin flushes produce three partitions, each with one
+    Three origins flushed at once produce three partitions, each with one
     small file. Optimize must succeed, bound the file count, keep the data
     intact and touch the freshness tag.
     """
@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 from typing import Generator
 
@@ -49,8 +50,11 @@ def test_repository_archive(repo, fixtures_path):
     assert not archive._tags.exists(tag.ARCHIVE_UPDATED)
 
     crawl = get_store(crawl_uri)
-    for key in crawl.iterate_keys():
-        archive.store(crawl.to_uri(key))
+    with archive.bulk():
+        for key in crawl.iterate_keys():
+            archive.store(crawl.to_uri(key))
+        # bulk defers the tag to a single write on exit
+        assert not archive._tags.exists(tag.ARCHIVE_UPDATED)
 
     # Tag should be set after store operations
     assert archive._tags.exists(tag.ARCHIVE_UPDATED)
@@ -265,3 +269,15 @@ def test_repository_archive_store_and_retrieve(repo, fixtures_path):
         assert archive.write_blob(fh) == checksum
     with archive.open(checksum) as fh:
         assert fh.read() == "Îș unî©ođ€.\n".encode()
+
+
+def test_repository_archive_bulk_per_thread(tmp_path, fixtures_path):
+    """A bulk block only defers the tag for stores of its own thread."""
+    archive = ArchiveRepository("test", tmp_path)
+    uri = fixtures_path / "src" / "utf.txt"
+
+    with archive.bulk():
+        thread = threading.Thread(target=archive.store, args=(uri,))
+        thread.start()
+        thread.join()
+        assert archive._tags.exists(tag.ARCHIVE_UPDATED)
@@ -427,3 +427,26 @@ def test_repository_entities_export_diff_no_changes(tmp_path):
     # Only one diff file should exist (initial)
     diff_files = list((tmp_path / path.DIFFS_ENTITIES).glob("*.delta.json"))
     assert len(diff_files) == 1
+
+
+def test_repository_entities_flush_first_only_when_dirty(tmp_path, monkeypatch):
+    """flush_first reads flush once per journal write, not once per read."""
+    repo = EntityRepository("test", tmp_path)
+    flushes: list[int] = []
+    flush = repo.flush
+
+    def counting_flush() -> int:
+        flushes.append(1)
+        return flush()
+
+    monkeypatch.setattr(repo, "flush", counting_flush)
+
+    repo.add(make_entity(JANE))
+    assert len(list(repo.query(flush_first=True))) == 1
+    assert repo.get("jane", flush_first=True) is not None
+    assert len(list(repo.query(flush_first=True))) == 1
+    assert len(flushes) == 1
+
+    repo.add(make_entity(JOHN))
+    assert len(list(repo.query(flush_first=True))) == 2
+    assert len(flushes) == 2
@@ -8,6 +8,8 @@ deliberately left to the reverse proxy (``client_max_body_size``,
 philosophy.
 """
 
+from typing import Generator
+
 import pytest
 from fastapi.testclient import TestClient
 from ftmq.query import M, Query
@@ -16,10 +18,15 @@ from ftm_lakehouse.api import dependencies
 from ftm_lakehouse.api.main import get_app
 
 
-@pytest.fixture()
-def client(tmp_path) -> TestClient:
-    app = get_app(lake_uri=str(tmp_path))
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def client(tmp_path_factory) -> Generator[TestClient, None, None]:
+    # every request here is rejected before touching the lakehouse, so the
+    # tests share one app instead of building it per test. Entered once, the
+    # client keeps one event loop thread for all requests instead of
+    # starting one per request.
+    app = get_app(lake_uri=str(tmp_path_factory.mktemp("lake")))
+    with TestClient(app) as client:
+        yield client
 
 
 def _error_messages(response) -> str:
@@ -73,7 +80,7 @@ def test_query_rejects_oversized_rql_id_list(client, monkeypatch) -> None:
 
 def test_query_rejects_malformed_rql(client) -> None:
     """Malformed RQL maps to a 400, before any streaming starts."""
-    for endpoint in ("query", "statements/query"):
+    for endpoint in ("query", "count", "statements/query"):
         response = client.post(
             f"/test_ds/_api/entities/{endpoint}", json={"query": "in(entity_id,"}
         )
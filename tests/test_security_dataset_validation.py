@@ -80,11 +80,10 @@ def test_api_dataset_name_dependency_rejects_invalid() -> None:
 def test_api_returns_400_on_invalid_dataset_name(tmp_path) -> None:
     """End-to-end: an invalid dataset name in the URL produces a 400."""
     app = get_app(lake_uri=str(tmp_path))
-    client = TestClient(app)
+    with TestClient(app) as client:
+        response = client.get("/catalog/_api/entities/stats")
+        assert response.status_code == 400
+        assert "reserved" in response.json()["detail"].lower()
 
-    response = client.get("/catalog/_api/entities/stats")
-    assert response.status_code == 400
-    assert "reserved" in response.json()["detail"].lower()
-
-    response = client.get("/foo%20bar/_api/entities/stats")
-    assert response.status_code == 400
+        response = client.get("/foo%20bar/_api/entities/stats")
+        assert response.status_code == 400
@@ -5,12 +5,14 @@ from datetime import datetime, timezone
 
 import pyarrow as pa
 from followthemoney import Statement
+from ftmq.query import P, Query
 from ftmq.store.base import DEFAULT_ORIGIN
 from ftmq.store.lake import pack_statement
 
 from ftm_lakehouse.core.conventions import tag
 from ftm_lakehouse.core.conventions.path import entity_shard
 from ftm_lakehouse.model.statement import SHARDED_SCHEMA, TABLE_RAW
+from ftm_lakehouse.storage import parquet
 from ftm_lakehouse.storage.parquet import ParquetStore
 
 DATASET = "test"
@@ -86,6 +88,27 @@ def test_storage_parquet_query_statements(tmp_path):
     assert name_values == {"Jane Doe", "John Smith"}
 
 
+def test_storage_parquet_query_comparison_filters(tmp_path):
+    """Non-equality property filters render as DuckDB SQL on the
+    partitioned read path."""
+    store = ParquetStore(tmp_path, DATASET, shards=SHARDS)
+
+    stmts = [
+        make_statement("jane", "name", "Jane Doe"),
+        make_statement("jane", "birthDate", "1970"),
+        make_statement("john", "name", "John O'Brien"),
+        make_statement("john", "birthDate", "1950"),
+    ]
+    _flush(store, [_pack(s) for s in stmts])
+
+    entities = list(store.query(Query().where(P(birthDate__gt="1960"))))
+    assert [e.id for e in entities] == ["jane"]
+    entities = list(store.query(Query().where(P(name__like="John O'%"))))
+    assert [e.id for e in entities] == ["john"]
+    entities = list(store.query(Query().where(P(name__ilike="jane%"))))
+    assert [e.id for e in entities] == ["jane"]
+
+
 def test_storage_parquet_append_keeps_duplicates(tmp_path):
     """Append-only: re-flushing the same statement does NOT dedupe on write."""
     store = ParquetStore(tmp_path, DATASET, shards=SHARDS)
@@ -98,6 +121,27 @@ def test_storage_parquet_append_keeps_duplicates(tmp_path):
     assert _row_count(store) == 2
 
 
+def test_storage_parquet_partition_stats(tmp_path):
+    """Physical per-partition counters come from the Delta log."""
+    store = ParquetStore(tmp_path, DATASET, shards=SHARDS)
+    assert store.partition_stats().num_rows == 0
+
+    stmt = make_statement("jane", "name", "Jane Doe")
+    _flush(store, [_pack(stmt)])
+    _flush(store, [_pack(stmt), _pack(make_statement("jane", "firstName", "Jane"))])
+
+    (partition,) = store.partition_stats().to_pylist()
+    assert partition["shard"] == entity_shard("jane", SHARDS)
+    assert partition["files"] == 2
+    assert partition["rows"] == _row_count(store) == 3
+    assert partition["size"] > 0
+
+    store.compact()
+    (partition,) = store.partition_stats().to_pylist()
+    assert partition["files"] == 1
+    assert partition["rows"] == 3
+
+
 def test_storage_parquet_merge_collapses_duplicates(tmp_path):
     """merge() folds duplicate statements per partition."""
     store = ParquetStore(tmp_path, DATASET, shards=SHARDS)
@@ -234,3 +278,64 @@ def test_storage_parquet_get_statements_uses_shard(tmp_path):
     assert len(jane) == 1 and jane[0].entity_id == "e-jane"
     assert len(john) == 1 and john[0].entity_id == "e-john"
     assert nobody == []
+
+
+def test_storage_parquet_query_prunes_origin_partitions(tmp_path):
+    """An origin-filtered read only visits (shard, bucket) pairs holding a
+    partition of that origin."""
+    store = ParquetStore(tmp_path, DATASET, shards=SHARDS)
+
+    jane = _pack(make_statement("e-jane", "name", "Jane Doe"))
+    jane["origin"] = "registry"
+    john = _pack(make_statement("e-john", "name", "John Smith"))
+    john["origin"] = "filings"
+    _flush(store, [jane, john])
+
+    pairs = list(store._iter_shard_buckets(origin="registry"))
+    assert pairs == [(jane["shard"], jane["bucket"])]
+    assert list(store._iter_shard_buckets(origin="nope")) == []
+
+    entities = list(store.query(origin="filings"))
+    assert [e.id for e in entities] == ["e-john"]
+    stmts = list(store.query_statements(origin="registry"))
+    assert [s.entity_id for s in stmts] == ["e-jane"]
+
+
+def test_storage_parquet_get_by_origin(tmp_path):
+    """get(entity_id, origin=...) assembles the entity from that origin's
+    statements only."""
+    store = ParquetStore(tmp_path, DATASET, shards=SHARDS)
+
+    name = _pack(make_statement("e-jane", "name", "Jane Doe"))
+    name["origin"] = "registry"
+    birth = _pack(make_statement("e-jane", "birthDate", "1970"))
+    birth["origin"] = "filings"
+    _flush(store, [name, birth])
+
+    jane = store.get("e-jane")
+    assert jane is not None
+    assert jane.first("name") == "Jane Doe"
+    assert jane.first("birthDate") == "1970"
+
+    registry = store.get("e-jane", origin="registry")
+    assert registry is not None
+    assert registry.first("name") == "Jane Doe"
+    assert registry.first("birthDate") is None
+    assert store.get("e-jane", origin="nope") is None
+
+
+def test_parquet_store_storage_setup(monkeypatch):
+    """DuckDB storage setup re-runs only when the storage options change."""
+    calls = []
+    options = {"AWS_ENDPOINT_URL": "http://a"}
+    monkeypatch.setattr(parquet, "_STORAGE_OPTIONS", None)
+    monkeypatch.setattr(parquet, "storage_options", lambda: dict(options))
+    monkeypatch.setattr(parquet, "setup_duckdb_storage", lambda: calls.append(1))
+
+    parquet.ensure_duckdb_storage()
+    parquet.ensure_duckdb_storage()
+    assert len(calls) == 1
+
+    options["AWS_ENDPOINT_URL"] = "http://b"
+    parquet.ensure_duckdb_storage()
+    assert len(calls) == 2
@@ -0,0 +1,35 @@
+"""Tests for TagStore - key-value freshness tracking."""
+
+from datetime import datetime, timedelta, timezone
+
+from ftm_lakehouse.storage.tags import TagStore
+
+
+def test_storage_tags_is_latest(tmp_path):
+    tags = TagStore(tmp_path)
+    now = datetime.now(timezone.utc)
+
+    # missing target or no existing dependencies are never latest
+    assert not tags.is_latest("target", ["dep"])
+    tags.set("target", now)
+    assert not tags.is_latest("target", ["dep"])
+    assert not tags.is_latest("target", [])
+
+    tags.set("dep", now - timedelta(seconds=1))
+    assert tags.is_latest("target", ["dep", "missing"])
+
+    tags.set("dep", now)
+    assert not tags.is_latest("target", ["dep"])
+
+
+def test_storage_tags_is_latest_short_circuits(tmp_path):
+    tags = TagStore(tmp_path)
+    now = datetime.now(timezone.utc)
+    tags.set("target", now)
+    tags.set("stale", now + timedelta(seconds=1))
+
+    def dependencies():
+        yield "stale"
+        raise AssertionError("dependencies after a stale one must not be fetched")
+
+    assert not tags.is_latest("target", dependencies())
@@ -4,8 +4,10 @@ import re
 from datetime import datetime, timezone
 
 from anystore.model import BaseModel
+from moto import mock_aws
 
-from ftm_lakehouse.storage.versions import VersionedModelStore
+from ftm_lakehouse.storage import versions as versions_module
+from ftm_lakehouse.storage.versions import VersionedModelStore, VersionStore
 
 
 class VersionedData(BaseModel):
@@ -217,3 +219,70 @@ def test_storage_versions_yaml_serialization(tmp_path):
     # Get via store should return the model
     retrieved = store.get("config.yml")
     assert retrieved.name == "yaml_test"
+
+
+def test_storage_versions_list_versions_exact_key(tmp_path):
+    """Test that listing versions doesn't match other keys sharing a suffix."""
+    store = VersionedModelStore(tmp_path, model=VersionedData)
+
+    store.make("statistics.json", VersionedData(name="root"))
+    store.make("exports/statistics.json", VersionedData(name="nested"))
+
+    assert len(store.list_versions("statistics.json")) == 1
+    (nested,) = store.list_versions("exports/statistics.json")
+    assert nested.endswith("/exports/statistics.json")
+
+
+def _record_puts(versions: VersionStore, monkeypatch) -> list[str]:
+    puts: list[str] = []
+    put = versions._store.put
+
+    def _put(key, *args, **kwargs):
+        puts.append(key)
+        return put(key, *args, **kwargs)
+
+    monkeypatch.setattr(versions._store, "put", _put)
+    return puts
+
+
+def test_storage_versions_copy_local(tmp_path, monkeypatch):
+    """Local stores write the main key again instead of linking it."""
+    versions = VersionStore(tmp_path)
+    puts = _record_puts(versions, monkeypatch)
+    versioned_path = versions.make("config.json", VersionedData(name="local"))
+    assert puts == [versioned_path, "config.json"]
+
+    main, snapshot = tmp_path / "config.json", tmp_path / versioned_path
+    assert main.read_bytes() == snapshot.read_bytes()
+    assert main.stat().st_ino != snapshot.stat().st_ino
+
+
+def test_storage_versions_copy_server_side(moto_server, monkeypatch):
+    """Remote stores copy the snapshot to the main key server-side, so the
+    payload is uploaded once."""
+    with mock_aws():
+        moto_server.create_bucket(Bucket="lakehouse")
+        versions = VersionStore("s3://lakehouse/versions_copy")
+        puts = _record_puts(versions, monkeypatch)
+        versioned_path = versions.make("config.json", VersionedData(name="copied"))
+        assert puts == [versioned_path]
+        assert versions.get("config.json", VersionedData).name == "copied"
+
+
+def test_storage_versions_copy_fallback(moto_server, monkeypatch):
+    """A failing server-side copy falls back to writing the main key."""
+
+    class NoCopy:
+        def copy(self, *args, **kwargs):
+            raise PermissionError("no server-side copy")
+
+    monkeypatch.setattr(
+        versions_module, "url_to_fs", lambda uri, **kwargs: (NoCopy(), uri)
+    )
+    with mock_aws():
+        moto_server.create_bucket(Bucket="lakehouse")
+        versions = VersionStore("s3://lakehouse/versions_fallback")
+        puts = _record_puts(versions, monkeypatch)
+        versioned_path = versions.make("config.json", VersionedData(name="fallback"))
+        assert puts == [versioned_path, "config.json"]
+        assert versions.get("config.json", VersionedData).name == "fallback"
@@ -0,0 +1,24 @@
+from ftm_lakehouse.core.conventions import path, tag
+
+
+def test_convention_paths():
+    """The public file layout of a dataset – clients rely on these keys."""
+    assert path.INDEX == "index.json"
+    assert path.CONFIG == "config.yml"
+    assert path.ENTITIES_JSON == "entities.ftm.json"
+    assert path.EXPORTS_STATEMENTS == "exports/statements.csv"
+    assert path.EXPORTS_STATISTICS == "exports/statistics.json"
+    assert path.EXPORTS_DOCUMENTS == "exports/documents.csv"
+    assert path.DIFFS_ENTITIES == "diffs/entities.ftm.json"
+    assert path.DIFFS_DOCUMENTS == "diffs/exports/documents.csv"
+
+
+def test_convention_tags():
+    """Tag keys persist in existing lakes, renaming them resets freshness."""
+    assert tag.STATEMENTS_UPDATED == "statements/last_updated"
+    assert tag.JOURNAL_UPDATED == "journal/last_updated"
+    assert tag.JOURNAL_FLUSHED == "journal/last_flushed"
+    assert tag.ARCHIVE_UPDATED == "archive/last_updated"
+    assert tag.OP_CRAWL == "operations/crawl/last_run"
+    assert tag.OP_DOWNLOAD_ARCHIVE == "operations/download_archive/last_run"
+    assert tag.OP_MAKE == "operations/make/last_run"